@@ -3,46 +3,36 @@ import streamlit as st
 # Get query params for embedded mode
 # Need to do this before st.set_page_config
 import re
+from functools import lru_cache
 from urllib.parse import parse_qs
 
 # Get URL query parameters for embedding functionality
 query_params = st.query_params
 
+def _qp(name, default=None, lower=True):
+    """
+    Read a single query parameter, unwrapping the legacy list form and
+    normalizing to a (lowercased) string. Returns default when absent.
+    """
+    value = query_params.get(name, default)
+    if isinstance(value, list):
+        value = value[0] if value else default
+    if value is None:
+        return None
+    value = str(value)
+    return value.lower() if lower else value
+
 # Check if we're in embedded mode
-embedded = False
-if 'embed' in query_params:
-    embed_value = query_params.get('embed')
-    if isinstance(embed_value, list) and len(embed_value) > 0:
-        embedded = embed_value[0].lower() == 'true'
-    else:
-        embedded = str(embed_value).lower() == 'true'
+embedded = _qp('embed', default='false') == 'true'
 
 # Get theme preference
-theme = 'light'
-if 'theme' in query_params:
-    theme_value = query_params.get('theme')
-    if isinstance(theme_value, list) and len(theme_value) > 0:
-        theme = theme_value[0]
-    else:
-        theme = str(theme_value)
+theme = _qp('theme', default='light', lower=False)
 
 # Check if branding should be shown
-show_branding = True
-if 'showBranding' in query_params:
-    branding_value = query_params.get('showBranding')
-    if isinstance(branding_value, list) and len(branding_value) > 0:
-        show_branding = branding_value[0].lower() == 'true'
-    else:
-        show_branding = str(branding_value).lower() == 'true'
+show_branding = _qp('showBranding', default='true') == 'true'
 
 # Check for parent website for customization
-parent_site = None
-if 'parentSite' in query_params:
-    parent_value = query_params.get('parentSite')
-    if isinstance(parent_value, list) and len(parent_value) > 0:
-        parent_site = parent_value[0].lower()
-    else:
-        parent_site = str(parent_value).lower()
+parent_site = _qp('parentSite')
 
 # Special handling for Earth Carbon Foundation
 is_earth_carbon = parent_site == 'earthcarbonfoundation.org'
@@ -56,14 +46,12 @@ st.set_page_config(
 )
 
 import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from io import BytesIO
 import os
 import json
 
 # Import custom modules
+# (plotly is only imported indirectly via visualizations; report_generator
+# is deferred to the Results tab since it drags in ReportLab/xlsxwriter)
 import ghg_protocol as ghg
 import emission_factors as ef
 import visualizations as viz
@@ -71,38 +59,247 @@ import recommendations as rec
 import database as db
 import history
 import carbon_offsets as co
-import report_generator as report
 import eco_challenge as eco
 
 # We already have the query parameters defined at the top
 
+# Declarative specs for the repeated number-input groups: (label, key, step).
+# Specs are listed row-major so the rendered column layout matches the
+# original hand-written column blocks.
+_SCOPE1_STATIONARY_INPUTS = [
+    ("Natural Gas (m³)", "natural_gas", 100.0),
+    ("Propane (liters)", "propane", 100.0),
+    ("Diesel (liters)", "diesel", 100.0),
+    ("Fuel Oil (liters)", "fuel_oil", 100.0)
+]
+
+_SCOPE1_MOBILE_INPUTS = [
+    ("Gasoline (liters)", "gasoline", 100.0),
+    ("Jet Fuel (liters)", "jet_fuel", 100.0),
+    ("Diesel for Vehicles (liters)", "diesel_vehicles", 100.0)
+]
+
+_SCOPE3_WASTE_INPUTS = [
+    ("Landfill Waste (tons)", "landfill_waste", 1.0),
+    ("Composted Waste (tons)", "composted_waste", 1.0),
+    ("Recycled Waste (tons)", "recycled_waste", 1.0),
+    ("Incinerated Waste (tons)", "incinerated_waste", 1.0)
+]
+
+def _num_inputs(specs, cols=2):
+    """
+    Render a group of non-negative number inputs across columns from a
+    (label, key, step) spec table. Returns the entered values keyed by name.
+    """
+    columns = st.columns(cols)
+    vals = {}
+    for i, (label, key, step) in enumerate(specs):
+        with columns[i % cols]:
+            vals[key] = st.number_input(label, min_value=0.0, step=step, key=key)
+    return vals
+
+# Fixed mode breakdowns for single-mode commutes; "Mixed" is built from the sliders
+_COMMUTE_FIXED = {
+    "Car (Single Occupancy)": {"car": 1, "carpool": 0, "public_transit": 0, "walking_biking": 0, "wfh": 0},
+    "Carpool": {"car": 0, "carpool": 1, "public_transit": 0, "walking_biking": 0, "wfh": 0},
+    "Public Transit": {"car": 0, "carpool": 0, "public_transit": 1, "walking_biking": 0, "wfh": 0},
+    "Walking/Biking": {"car": 0, "carpool": 0, "public_transit": 0, "walking_biking": 1, "wfh": 0},
+    "Work from Home": {"car": 0, "carpool": 0, "public_transit": 0, "walking_biking": 0, "wfh": 1}
+}
+
+@st.cache_resource
+def _base_url():
+    """
+    Discover the base URL of the deployed app once per process.
+
+    The fallback path imports and introspects the Streamlit server, which
+    is too expensive to repeat on every rerun of the branded sidebar.
+    """
+    url = os.environ.get('REPLIT_URL', '')
+    if not url:
+        try:
+            from streamlit.web.server.server import Server
+            url = Server.get_current().get_base_url()
+        except Exception:
+            url = ''
+    return url or './'
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _compute_all(scope1_kwargs, scope2_kwargs, scope3_kwargs):
+    """
+    Run all GHG Protocol calculations for the given inputs.
+
+    Cached so that Streamlit reruns (tab switches, unrelated widget changes)
+    with identical inputs skip the recomputation entirely.
+
+    Returns a tuple of the eight per-category emission values.
+    """
+    scope1_stationary = ghg.calculate_stationary_combustion(
+        natural_gas=scope1_kwargs["natural_gas"],
+        diesel=scope1_kwargs["diesel"],
+        propane=scope1_kwargs["propane"],
+        fuel_oil=scope1_kwargs["fuel_oil"]
+    )
+
+    scope1_mobile = ghg.calculate_mobile_combustion(
+        gasoline=scope1_kwargs["gasoline"],
+        diesel=scope1_kwargs["diesel_vehicles"],
+        jet_fuel=scope1_kwargs["jet_fuel"]
+    )
+
+    scope1_refrigerants = ghg.calculate_refrigerant_emissions(
+        refrigerant_type=scope1_kwargs["refrigerant_type"],
+        amount=scope1_kwargs["refrigerant_amount"]
+    )
+
+    scope2_electricity = ghg.calculate_electricity_emissions(
+        electricity=scope2_kwargs["electricity"],
+        grid_region=scope2_kwargs["grid_region"],
+        electricity_source=scope2_kwargs["electricity_source"]
+    )
+
+    scope3_business_travel = ghg.calculate_business_travel_emissions(
+        air_travel_short=scope3_kwargs["air_travel_short"],
+        air_travel_medium=scope3_kwargs["air_travel_medium"],
+        air_travel_long=scope3_kwargs["air_travel_long"],
+        car_rental=scope3_kwargs["car_rental"],
+        hotel_stays=scope3_kwargs["hotel_stays"]
+    )
+
+    scope3_employee_commuting = ghg.calculate_employee_commuting_emissions(
+        avg_commute_distance=scope3_kwargs["avg_commute_distance"],
+        num_employees=scope3_kwargs["num_employees"],
+        commute_days_per_year=scope3_kwargs["commute_days_per_year"],
+        commute_mode=scope3_kwargs["commute_mode"],
+        mode_breakdown=scope3_kwargs["mode_breakdown"]
+    )
+
+    scope3_waste = ghg.calculate_waste_emissions(
+        landfill_waste=scope3_kwargs["landfill_waste"],
+        recycled_waste=scope3_kwargs["recycled_waste"],
+        composted_waste=scope3_kwargs["composted_waste"],
+        incinerated_waste=scope3_kwargs["incinerated_waste"]
+    )
+
+    scope3_purchased_goods = ghg.calculate_purchased_goods_emissions(
+        purchased_goods=scope3_kwargs["purchased_goods"],
+        industry=scope3_kwargs["industry"]
+    )
+
+    return (scope1_stationary, scope1_mobile, scope1_refrigerants,
+            scope2_electricity, scope3_business_travel, scope3_employee_commuting,
+            scope3_waste, scope3_purchased_goods)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _fig_by_scope(scope_items):
+    """
+    Cached wrapper around the scope pie chart builder.
+
+    Takes the emissions dict as a sorted tuple of items so Streamlit can
+    hash it; the Figure is rebuilt only when the emissions change.
+    """
+    return viz.create_emissions_by_scope_chart(dict(scope_items))
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _fig_by_category(category_items):
+    """
+    Cached wrapper around the category bar chart builder.
+    """
+    return viz.create_emissions_by_category_chart(dict(category_items))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_offset_recs(scope_items, cat_items, industry, budget_per_tonne, location, offset_percentage):
+    """
+    Cached carbon offset recommendations; dict inputs arrive as sorted
+    item tuples so repeated clicks with identical settings hit the cache.
+    """
+    return co.get_offset_recommendations(
+        dict(scope_items),
+        dict(cat_items),
+        industry=industry,
+        budget_per_tonne=budget_per_tonne,
+        location=location,
+        offset_percentage=offset_percentage
+    )
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_offset_html(scope_items, cat_items, industry, budget_per_tonne, location, offset_percentage):
+    """
+    Cached HTML rendering of the offset recommendations, keyed on the
+    same inputs as _cached_offset_recs.
+    """
+    recommendations = _cached_offset_recs(scope_items, cat_items, industry,
+                                          budget_per_tonne, location, offset_percentage)
+    return co.format_offset_results_html(recommendations)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_pdf(org, industry, year, n_emp, total, scope_items, cat_items, rec_items):
+    """
+    Cached PDF report bytes. Dict inputs are passed as sorted item tuples
+    so the cache can key on them; the ReportLab build only runs when the
+    inputs actually change.
+    """
+    return report.generate_pdf_report(
+        organization_name=org,
+        industry=industry,
+        reporting_year=year,
+        num_employees=n_emp,
+        total_emissions=total,
+        emissions_by_scope=dict(scope_items),
+        emissions_by_category=dict(cat_items),
+        recommendations={k: list(v) for k, v in rec_items}
+    )
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_excel(org, industry, year, n_emp, total, scope_items, cat_items, rec_items):
+    """
+    Cached Excel report bytes; same keying scheme as _cached_pdf.
+    """
+    return report.generate_excel_report(
+        organization_name=org,
+        industry=industry,
+        reporting_year=year,
+        num_employees=n_emp,
+        total_emissions=total,
+        emissions_by_scope=dict(scope_items),
+        emissions_by_category=dict(cat_items),
+        recommendations={k: list(v) for k, v in rec_items}
+    )
+
 # Original page config already set at top
 # No need to update layout dynamically - the embedded CSS will take care of appearance
 
-# Custom CSS for embedded mode
-if embedded:
-    # Define CSS based on theme
-    if theme == 'dark':
-        background_color = "#121212"
-        text_color = "#f1f1f1"
-        card_bg_color = "#1e1e1e"
-        border_color = "#333333"
-    else:  # light theme
-        background_color = "#ffffff"
-        text_color = "#333333"
-        card_bg_color = "#f9f9f9"
-        border_color = "#e0e0e0"
-    
-    # Earth Carbon Foundation custom theme
-    if is_earth_carbon:
-        button_color = "#336633"  # Earth green
-        button_hover_color = "#254D25"  # Darker green
-    else:
-        button_color = "#4CAF50"  # Default green
-        button_hover_color = "#45a049"  # Default hover
-    
-    # Apply CSS
-    st.markdown(f"""
+# Theme palettes for embedded mode: (background, text, card background, border)
+_PALETTES = {
+    'light': ("#ffffff", "#333333", "#f9f9f9", "#e0e0e0"),
+    'dark': ("#121212", "#f1f1f1", "#1e1e1e", "#333333")
+}
+
+# Button colors keyed by whether the parent site is Earth Carbon Foundation:
+# (button, button hover)
+_BRAND = {
+    True: ("#336633", "#254D25"),   # Earth green / darker green
+    False: ("#4CAF50", "#45a049")   # Default green / default hover
+}
+
+# Sidebar link label, keyed the same way as _BRAND
+_LINK_TEXT = {
+    True: "View full Earth Carbon Calculator",
+    False: "Open calculator in new window"
+}
+
+@lru_cache(maxsize=8)
+def _embed_css(theme, is_earth_carbon):
+    """
+    Build the embedded-mode CSS block for a theme/branding combination.
+
+    Memoized so the ~2KB f-string is only formatted once per combination
+    rather than on every script rerun.
+    """
+    background_color, text_color, card_bg_color, border_color = _PALETTES.get(theme, _PALETTES['light'])
+    button_color, button_hover_color = _BRAND[is_earth_carbon]
+
+    return f"""
     <style>
         .embedded-calculator {{
             font-family: 'Helvetica Neue', Arial, sans-serif;
@@ -168,7 +365,11 @@ if embedded:
         }}
     </style>
     <div class="embedded-calculator"></div>
-    """, unsafe_allow_html=True)
+    """
+
+# Custom CSS for embedded mode
+if embedded:
+    st.markdown(_embed_css(theme, is_earth_carbon), unsafe_allow_html=True)
 
 # Main title
 st.title("Carbon Footprint Calculator")
@@ -194,32 +395,22 @@ with st.sidebar:
             st.markdown("<div style='text-align: center; opacity: 0.7;'>Powered by<br/>Carbon Footprint App</div>", 
                         unsafe_allow_html=True)
                         
-        # Get current URL and remove query parameters for the full app URL
-        from urllib.parse import urlparse
-        import os
-        
-        # Try to get the app URL from environment or fallback to a request-based approach
-        try:
-            base_url = os.environ.get('REPLIT_URL', '')
-            if not base_url:
-                # Try alternative ways to get the URL
-                from streamlit.web.server.server import Server
-                base_url = Server.get_current().get_base_url()
-                
-            # If still no URL, use a basic fallback
-            if not base_url:
-                base_url = './'
-        except:
-            base_url = './'
-        
-        # Custom link text for different sites    
-        link_text = "Open calculator in new window"
-        if is_earth_carbon:
-            link_text = "View full Earth Carbon Calculator"
-            
+        # App URL for the "open in new window" link (discovered once per process)
+        base_url = _base_url()
+
+        # Custom link text for different sites
+        link_text = _LINK_TEXT[is_earth_carbon]
+
+
         st.markdown(f"<div style='text-align: center; font-size: 0.8em;'><a href='{base_url}' target='_blank'>{link_text}</a></div>", 
                     unsafe_allow_html=True)
 
+# Ensure database tables exist; init_db is cached so only the first
+# session per process pays the metadata round-trips
+if 'db_init' not in st.session_state:
+    db.init_db()
+    st.session_state.db_init = True
+
 # Initialize session state for storing results
 if 'total_emissions' not in st.session_state:
     st.session_state.total_emissions = 0
@@ -230,8 +421,12 @@ if 'emissions_by_category' not in st.session_state:
 if 'input_complete' not in st.session_state:
     st.session_state.input_complete = False
 
-# Add Eco-Challenge CSS
-eco.add_eco_challenge_css()
+# Add Eco-Challenge CSS (payload resolved once per process)
+@st.cache_resource
+def _eco_css_payload():
+    return eco.get_eco_challenge_css()
+
+st.markdown(_eco_css_payload(), unsafe_allow_html=True)
 
 # Main content - Hide history tab in embedded mode
 if embedded:
@@ -259,22 +454,18 @@ with tab1:
     st.subheader("Scope 1: Direct Emissions")
     
     st.markdown("##### Stationary Combustion")
-    col1, col2 = st.columns(2)
-    with col1:
-        natural_gas = st.number_input("Natural Gas (m³)", min_value=0.0, step=100.0)
-        diesel = st.number_input("Diesel (liters)", min_value=0.0, step=100.0)
-    with col2:
-        propane = st.number_input("Propane (liters)", min_value=0.0, step=100.0)
-        fuel_oil = st.number_input("Fuel Oil (liters)", min_value=0.0, step=100.0)
-    
+    stationary_vals = _num_inputs(_SCOPE1_STATIONARY_INPUTS)
+    natural_gas = stationary_vals["natural_gas"]
+    diesel = stationary_vals["diesel"]
+    propane = stationary_vals["propane"]
+    fuel_oil = stationary_vals["fuel_oil"]
+
     st.markdown("##### Mobile Combustion (Company Vehicles)")
-    col1, col2 = st.columns(2)
-    with col1:
-        gasoline = st.number_input("Gasoline (liters)", min_value=0.0, step=100.0)
-        diesel_vehicles = st.number_input("Diesel for Vehicles (liters)", min_value=0.0, step=100.0)
-    with col2:
-        jet_fuel = st.number_input("Jet Fuel (liters)", min_value=0.0, step=100.0)
-        
+    mobile_vals = _num_inputs(_SCOPE1_MOBILE_INPUTS)
+    gasoline = mobile_vals["gasoline"]
+    diesel_vehicles = mobile_vals["diesel_vehicles"]
+    jet_fuel = mobile_vals["jet_fuel"]
+
     st.markdown("##### Refrigerants & Process Emissions")
     col1, col2 = st.columns(2)
     with col1:
@@ -350,13 +541,11 @@ with tab1:
                 st.warning(f"Percentages should total 100%. Current total: {total_percent}%")
     
     st.markdown("##### Waste Generation")
-    col1, col2 = st.columns(2)
-    with col1:
-        landfill_waste = st.number_input("Landfill Waste (tons)", min_value=0.0, step=1.0)
-        recycled_waste = st.number_input("Recycled Waste (tons)", min_value=0.0, step=1.0)
-    with col2:
-        composted_waste = st.number_input("Composted Waste (tons)", min_value=0.0, step=1.0)
-        incinerated_waste = st.number_input("Incinerated Waste (tons)", min_value=0.0, step=1.0)
+    waste_vals = _num_inputs(_SCOPE3_WASTE_INPUTS)
+    landfill_waste = waste_vals["landfill_waste"]
+    recycled_waste = waste_vals["recycled_waste"]
+    composted_waste = waste_vals["composted_waste"]
+    incinerated_waste = waste_vals["incinerated_waste"]
     
     st.markdown("##### Purchased Goods and Services")
     purchased_goods = st.number_input("Annual Procurement Spend ($)", min_value=0, step=10000)
@@ -366,67 +555,58 @@ with tab1:
     
     if calculate_button:
         with st.spinner("Calculating your carbon footprint..."):
-            # Calculate Scope 1 emissions
-            scope1_stationary = ghg.calculate_stationary_combustion(
-                natural_gas=natural_gas,
-                diesel=diesel,
-                propane=propane,
-                fuel_oil=fuel_oil
-            )
-            
-            scope1_mobile = ghg.calculate_mobile_combustion(
-                gasoline=gasoline,
-                diesel=diesel_vehicles,
-                jet_fuel=jet_fuel
-            )
-            
-            scope1_refrigerants = ghg.calculate_refrigerant_emissions(
-                refrigerant_type=refrigerant_type,
-                amount=refrigerant_amount
-            )
-            
-            # Calculate Scope 2 emissions
-            scope2_electricity = ghg.calculate_electricity_emissions(
-                electricity=electricity,
-                grid_region=grid_region,
-                electricity_source=electricity_source
-            )
-            
-            # Calculate Scope 3 emissions
-            scope3_business_travel = ghg.calculate_business_travel_emissions(
-                air_travel_short=air_travel_short,
-                air_travel_medium=air_travel_medium,
-                air_travel_long=air_travel_long,
-                car_rental=car_rental,
-                hotel_stays=hotel_stays
-            )
-            
-            scope3_employee_commuting = ghg.calculate_employee_commuting_emissions(
-                avg_commute_distance=avg_commute_distance,
-                num_employees=num_employees,
-                commute_days_per_year=commute_days_per_year,
-                commute_mode=commute_mode,
-                mode_breakdown={
-                    "car": car_percent/100 if commute_mode == "Mixed" else (1 if commute_mode == "Car (Single Occupancy)" else 0),
-                    "carpool": carpool_percent/100 if commute_mode == "Mixed" else (1 if commute_mode == "Carpool" else 0),
-                    "public_transit": public_transit_percent/100 if commute_mode == "Mixed" else (1 if commute_mode == "Public Transit" else 0),
-                    "walking_biking": walking_biking_percent/100 if commute_mode == "Mixed" else (1 if commute_mode == "Walking/Biking" else 0),
-                    "wfh": wfh_percent/100 if commute_mode == "Mixed" else (1 if commute_mode == "Work from Home" else 0)
-                }
-            )
-            
-            scope3_waste = ghg.calculate_waste_emissions(
-                landfill_waste=landfill_waste,
-                recycled_waste=recycled_waste,
-                composted_waste=composted_waste,
-                incinerated_waste=incinerated_waste
-            )
-            
-            scope3_purchased_goods = ghg.calculate_purchased_goods_emissions(
-                purchased_goods=purchased_goods,
-                industry=industry
+            # Group the widget values so the cached calculator can key on them
+            scope1_kwargs = {
+                "natural_gas": natural_gas,
+                "diesel": diesel,
+                "propane": propane,
+                "fuel_oil": fuel_oil,
+                "gasoline": gasoline,
+                "diesel_vehicles": diesel_vehicles,
+                "jet_fuel": jet_fuel,
+                "refrigerant_type": refrigerant_type,
+                "refrigerant_amount": refrigerant_amount
+            }
+
+            scope2_kwargs = {
+                "electricity": electricity,
+                "grid_region": grid_region,
+                "electricity_source": electricity_source
+            }
+
+            scope3_kwargs = {
+                "air_travel_short": air_travel_short,
+                "air_travel_medium": air_travel_medium,
+                "air_travel_long": air_travel_long,
+                "car_rental": car_rental,
+                "hotel_stays": hotel_stays,
+                "avg_commute_distance": avg_commute_distance,
+                "num_employees": num_employees,
+                "commute_days_per_year": commute_days_per_year,
+                "commute_mode": commute_mode,
+                "mode_breakdown": ({
+                    "car": car_percent/100,
+                    "carpool": carpool_percent/100,
+                    "public_transit": public_transit_percent/100,
+                    "walking_biking": walking_biking_percent/100,
+                    "wfh": wfh_percent/100
+                } if commute_mode == "Mixed"
+                  else _COMMUTE_FIXED.get(commute_mode, _COMMUTE_FIXED["Car (Single Occupancy)"])),
+                "landfill_waste": landfill_waste,
+                "recycled_waste": recycled_waste,
+                "composted_waste": composted_waste,
+                "incinerated_waste": incinerated_waste,
+                "purchased_goods": purchased_goods,
+                "industry": industry
+            }
+
+            # Run all scope calculations (cached across reruns with identical inputs)
+            (scope1_stationary, scope1_mobile, scope1_refrigerants,
+             scope2_electricity, scope3_business_travel, scope3_employee_commuting,
+             scope3_waste, scope3_purchased_goods) = _compute_all(
+                scope1_kwargs, scope2_kwargs, scope3_kwargs
             )
-            
+
             # Aggregate results
             scope1_total = scope1_stationary + scope1_mobile + scope1_refrigerants
             scope2_total = scope2_electricity
@@ -464,7 +644,8 @@ with tab1:
             # Save results to database only if not in embedded mode
             if not embedded and organization_name:
                 try:
-                    # Prepare input data to save
+                    # Prepare input data to save. Built only on this branch so
+                    # embedded/unnamed calculations never pay for the nested dict.
                     input_data = {
                         "organization_info": {
                             "organization_name": organization_name,
@@ -527,6 +708,12 @@ with tab1:
                     
                     # Store record ID in session state
                     st.session_state.last_saved_id = record_id
+
+                    # Drop the cached history listing and comparison
+                    # roll-up so the new record shows up without waiting
+                    # for the TTL
+                    history._cached_all_footprints.clear()
+                    history._cached_footprint_summary.clear()
                     
                     # Notify user and switch to results tab
                     st.success(f"Calculation complete! Results saved to database (ID: {record_id}). View your results in the 'Results Dashboard' tab.")
@@ -543,13 +730,25 @@ with tab1:
 
 # Results Dashboard Tab
 with tab2:
-    if st.session_state.input_complete:
+    # Early exit on the cold-state path: nothing below has data to show
+    if not st.session_state.input_complete:
+        st.info("Please complete the 'Input Data' tab and calculate your carbon footprint to see results.")
+    else:
+        # Bind session state to locals once; SessionStateProxy attribute
+        # access goes through __getattr__ and this block reads it constantly
+        ss = st.session_state
+        total = ss.total_emissions
+        by_scope = ss.emissions_by_scope
+        by_cat = ss.emissions_by_category
+        recs = ss.recommendations
+        s1, s2, s3 = by_scope["Scope 1"], by_scope["Scope 2"], by_scope["Scope 3"]
+
         st.header("Carbon Footprint Results")
         
         # Total emissions card
         st.metric(
             "Total Carbon Footprint", 
-            f"{st.session_state.total_emissions:.2f} tonnes CO₂e"
+            f"{total:.2f} tonnes CO₂e"
         )
         
         # Key metrics in columns
@@ -557,40 +756,41 @@ with tab2:
         with col1:
             st.metric(
                 "Scope 1 Emissions", 
-                f"{st.session_state.emissions_by_scope['Scope 1']:.2f} tonnes CO₂e",
+                f"{s1:.2f} tonnes CO₂e",
                 help="Direct emissions from owned or controlled sources"
             )
         with col2:
             st.metric(
                 "Scope 2 Emissions", 
-                f"{st.session_state.emissions_by_scope['Scope 2']:.2f} tonnes CO₂e",
+                f"{s2:.2f} tonnes CO₂e",
                 help="Indirect emissions from purchased electricity, steam, heating, and cooling"
             )
         with col3:
             st.metric(
                 "Scope 3 Emissions", 
-                f"{st.session_state.emissions_by_scope['Scope 3']:.2f} tonnes CO₂e",
+                f"{s3:.2f} tonnes CO₂e",
                 help="All other indirect emissions in a company's value chain"
             )
         
         # Emissions visualization
         st.subheader("Emissions by Scope")
-        fig_by_scope = viz.create_emissions_by_scope_chart(st.session_state.emissions_by_scope)
+        fig_by_scope = _fig_by_scope(tuple(sorted(by_scope.items())))
         st.plotly_chart(fig_by_scope, use_container_width=True)
-        
+
         st.subheader("Emissions by Category")
-        fig_by_category = viz.create_emissions_by_category_chart(st.session_state.emissions_by_category)
+        fig_by_category = _fig_by_category(tuple(sorted(by_cat.items())))
         st.plotly_chart(fig_by_category, use_container_width=True)
         
         # Emissions breakdown table
         st.subheader("Detailed Emissions Breakdown")
         emissions_df = pd.DataFrame({
-            "Category": list(st.session_state.emissions_by_category.keys()),
-            "Emissions (tonnes CO₂e)": list(st.session_state.emissions_by_category.values())
+            "Category": list(by_cat.keys()),
+            "Emissions (tonnes CO₂e)": list(by_cat.values())
         })
-        emissions_df = emissions_df.sort_values("Emissions (tonnes CO₂e)", ascending=False)
-        emissions_df["Percentage"] = emissions_df["Emissions (tonnes CO₂e)"] / emissions_df["Emissions (tonnes CO₂e)"].sum() * 100
-        emissions_df["Percentage"] = emissions_df["Percentage"].apply(lambda x: f"{x:.1f}%")
+        emissions_df = emissions_df.sort_values("Emissions (tonnes CO₂e)", ascending=False, kind='stable')
+        pct = emissions_df["Emissions (tonnes CO₂e)"].to_numpy()
+        pct = pct / pct.sum() * 100
+        emissions_df["Percentage"] = [f"{v:.1f}%" for v in pct]
         
         st.dataframe(
             emissions_df,
@@ -603,123 +803,115 @@ with tab2:
         # Export functionality
         st.subheader("Export Results")
         
-        # Create data for export
-        # Summary data
-        summary_data = {
-            "Metric": ["Total Emissions", "Scope 1 Emissions", "Scope 2 Emissions", "Scope 3 Emissions"],
-            "Value (tonnes CO₂e)": [
-                st.session_state.total_emissions,
-                st.session_state.emissions_by_scope["Scope 1"],
-                st.session_state.emissions_by_scope["Scope 2"],
-                st.session_state.emissions_by_scope["Scope 3"]
-            ]
-        }
-        summary_df = pd.DataFrame(summary_data)
-        
-        # Recommendations data
-        recommendations_data = {
-            "Category": list(st.session_state.recommendations.keys()),
-            "Recommendations": [" | ".join(recs) for recs in st.session_state.recommendations.values()]
-        }
-        recommendations_df = pd.DataFrame(recommendations_data)
-        
+        # Create data for export, straight from the source dicts — no
+        # intermediate DataFrames needed for these tiny tables
+        summary_records = [
+            {"Metric": "Total Emissions", "Value (tonnes CO₂e)": total},
+            {"Metric": "Scope 1 Emissions", "Value (tonnes CO₂e)": s1},
+            {"Metric": "Scope 2 Emissions", "Value (tonnes CO₂e)": s2},
+            {"Metric": "Scope 3 Emissions", "Value (tonnes CO₂e)": s3}
+        ]
+
+        detailed_records = [
+            {"Category": category, "Emissions (tonnes CO₂e)": float(value), "Percentage": percentage}
+            for category, value, percentage in zip(emissions_df["Category"].values,
+                                                   emissions_df["Emissions (tonnes CO₂e)"].values,
+                                                   emissions_df["Percentage"].values)
+        ]
+
+        recommendations_records = [
+            {"Category": category, "Recommendations": " | ".join(rec_list)}
+            for category, rec_list in recs.items()
+        ]
+
         # Display data in expandable sections for easy copy-paste
         with st.expander("Summary Report - Click to view and copy"):
-            st.dataframe(summary_df)
-            
+            st.dataframe(summary_records)
+
             # Display formatted data
             st.subheader("Copy data as JSON:")
-            st.code(summary_df.to_json(orient='records'), language="json")
-            
+            st.code(json.dumps(summary_records), language="json")
+
             # Display as plain text for easier copying
             st.subheader("Or as plain text (tab-separated):")
-            summary_text = "Metric\tValue (tonnes CO₂e)\n"
-            for _, row in summary_df.iterrows():
-                summary_text += f"{row['Metric']}\t{row['Value (tonnes CO₂e)']:.2f}\n"
-            st.text_area("", summary_text, height=150)
-            
+            summary_parts = ["Metric\tValue (tonnes CO₂e)"]
+            summary_parts.extend(f"{r['Metric']}\t{r['Value (tonnes CO₂e)']:.2f}"
+                                 for r in summary_records)
+            st.text_area("", "\n".join(summary_parts), height=150)
+
         with st.expander("Detailed Report - Click to view and copy"):
             st.dataframe(emissions_df)
-            
+
             # Display formatted data
             st.subheader("Copy data as JSON:")
-            st.code(emissions_df.to_json(orient='records'), language="json")
-            
+            st.code(json.dumps(detailed_records), language="json")
+
             # Display as plain text
             st.subheader("Or as plain text (tab-separated):")
-            detailed_text = "Category\tEmissions (tonnes CO₂e)\tPercentage\n"
-            for _, row in emissions_df.iterrows():
-                detailed_text += f"{row['Category']}\t{row['Emissions (tonnes CO₂e)']:.2f}\t{row['Percentage']}\n"
-            st.text_area("", detailed_text, height=200)
-            
+            detailed_parts = ["Category\tEmissions (tonnes CO₂e)\tPercentage"]
+            detailed_parts.extend(f"{r['Category']}\t{r['Emissions (tonnes CO₂e)']:.2f}\t{r['Percentage']}"
+                                  for r in detailed_records)
+            st.text_area("", "\n".join(detailed_parts), height=200)
+
         with st.expander("Recommendations - Click to view and copy"):
-            st.dataframe(recommendations_df)
-            
+            st.dataframe(recommendations_records)
+
             # Display formatted data
             st.subheader("Copy data as JSON:")
-            st.code(recommendations_df.to_json(orient='records'), language="json")
+            st.code(json.dumps(recommendations_records), language="json")
             
             # Display as plain text
             st.subheader("Recommendations as plain text:")
-            recs_text = ""
-            for category, recs in st.session_state.recommendations.items():
-                recs_text += f"## {category}\n"
-                for rec in recs:
-                    recs_text += f"- {rec}\n"
-                recs_text += "\n"
-            st.text_area("", recs_text, height=200)
+            recs_parts = []
+            for category, rec_list in recs.items():
+                recs_parts.append(f"## {category}")
+                recs_parts.extend(f"- {rec}" for rec in rec_list)
+                recs_parts.append("")
+            st.text_area("", "\n".join(recs_parts), height=200)
             
         # Downloadable report options (only show if not in embedded mode)
         if not embedded:
             st.subheader("Download Complete Reports")
-            
+
+            # Deferred import: only the download section needs ReportLab/xlsxwriter
+            import report_generator as report
+
+            # Hashable keys for the cached report builders
+            scope_items = tuple(sorted(by_scope.items()))
+            cat_items = tuple(sorted(by_cat.items()))
+            rec_items = tuple(sorted((k, tuple(v)) for k, v in recs.items()))
+
             col1, col2 = st.columns(2)
-            
+
             with col1:
-                # Generate PDF report
-                pdf_data = report.generate_pdf_report(
-                    organization_name=organization_name,
-                    industry=industry,
-                    reporting_year=reporting_year,
-                    num_employees=num_employees,
-                    total_emissions=st.session_state.total_emissions,
-                    emissions_by_scope=st.session_state.emissions_by_scope,
-                    emissions_by_category=st.session_state.emissions_by_category,
-                    recommendations=st.session_state.recommendations
+                # Generate PDF report (cached across reruns)
+                pdf_data = _cached_pdf(
+                    organization_name, industry, reporting_year, num_employees,
+                    total, scope_items, cat_items, rec_items
                 )
-                
-                # Create download link
-                pdf_link = report.get_download_link(
-                    file_data=pdf_data,
+
+                # Native download button: bytes are sent only on click rather
+                # than base64-inlined into the page on every rerun
+                st.download_button(
+                    "Download PDF Report",
+                    data=pdf_data,
                     file_name=f"carbon_footprint_{organization_name.replace(' ', '_')}_{reporting_year}.pdf",
-                    display_text="Download PDF Report"
+                    mime="application/pdf"
                 )
                 
-                st.markdown(pdf_link, unsafe_allow_html=True)
-                
             with col2:
-                # Generate Excel report
-                excel_data = report.generate_excel_report(
-                    organization_name=organization_name,
-                    industry=industry,
-                    reporting_year=reporting_year,
-                    num_employees=num_employees,
-                    total_emissions=st.session_state.total_emissions,
-                    emissions_by_scope=st.session_state.emissions_by_scope,
-                    emissions_by_category=st.session_state.emissions_by_category,
-                    recommendations=st.session_state.recommendations
+                # Generate Excel report (cached across reruns)
+                excel_data = _cached_excel(
+                    organization_name, industry, reporting_year, num_employees,
+                    total, scope_items, cat_items, rec_items
                 )
-                
-                # Create download link
-                excel_link = report.get_download_link(
-                    file_data=excel_data,
+
+                st.download_button(
+                    "Download Excel Report",
+                    data=excel_data,
                     file_name=f"carbon_footprint_{organization_name.replace(' ', '_')}_{reporting_year}.xlsx",
-                    display_text="Download Excel Report"
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
                 )
-                
-                st.markdown(excel_link, unsafe_allow_html=True)
-    else:
-        st.info("Please complete the 'Input Data' tab and calculate your carbon footprint to see results.")
 
 # Recommendations Tab
 with tab3:
@@ -797,42 +989,44 @@ with tab4:
         and energy efficiency improvements.
         """)
         
-        # Offset controls
-        col1, col2 = st.columns(2)
-        with col1:
-            offset_percentage = st.slider("Percentage of emissions to offset", 
-                                         min_value=10, max_value=100, value=100, step=10,
-                                         help="Choose what percentage of your total emissions you want to offset")
-            
-            emissions_to_offset = st.session_state.total_emissions * (offset_percentage / 100)
-            st.info(f"Emissions to offset: {emissions_to_offset:.2f} tonnes CO₂e")
-        
-        with col2:
-            budget_per_tonne = st.number_input("Maximum budget per tonne (USD)", 
-                                              min_value=None, max_value=None, value=None,
-                                              help="Optional: Set a maximum price you're willing to pay per tonne of CO₂ offset")
-            
-            location = st.selectbox("Project location preference", 
-                                   ["Global", "North America", "Europe", "Asia Pacific", "Africa", "Latin America"],
-                                   help="Choose a geographic region where you prefer offset projects to be located")
-        
+        # Offset controls live in a form so dragging the slider or changing
+        # the selectbox doesn't rerun the whole tab; only submit does
+        with st.form("offset_form"):
+            col1, col2 = st.columns(2)
+            with col1:
+                offset_percentage = st.slider("Percentage of emissions to offset",
+                                             min_value=10, max_value=100, value=100, step=10,
+                                             help="Choose what percentage of your total emissions you want to offset")
+
+            with col2:
+                budget_per_tonne = st.number_input("Maximum budget per tonne (USD)",
+                                                  min_value=None, max_value=None, value=None,
+                                                  help="Optional: Set a maximum price you're willing to pay per tonne of CO₂ offset")
+
+                location = st.selectbox("Project location preference",
+                                       ["Global", "North America", "Europe", "Asia Pacific", "Africa", "Latin America"],
+                                       help="Choose a geographic region where you prefer offset projects to be located")
+
+            submitted = st.form_submit_button("Generate Offset Recommendations")
+
+        emissions_to_offset = st.session_state.total_emissions * (offset_percentage / 100)
+        st.info(f"Emissions to offset: {emissions_to_offset:.2f} tonnes CO₂e")
+
         # Get carbon offset recommendations
-        if st.button("Generate Offset Recommendations"):
+        if submitted:
             with st.spinner("Generating offset recommendations..."):
                 industry = "Other"  # Default value
                 if 'industry' in locals():
                     industry = industry
                 
-                # Get recommendations from the carbon_offsets module
-                offset_recommendations = co.get_offset_recommendations(
-                    st.session_state.emissions_by_scope,
-                    st.session_state.emissions_by_category,
-                    industry=industry,
-                    budget_per_tonne=budget_per_tonne,
-                    location=location,
-                    offset_percentage=offset_percentage
+                # Get recommendations from the carbon_offsets module (cached)
+                offset_scope_items = tuple(sorted(st.session_state.emissions_by_scope.items()))
+                offset_cat_items = tuple(sorted(st.session_state.emissions_by_category.items()))
+                offset_recommendations = _cached_offset_recs(
+                    offset_scope_items, offset_cat_items, industry,
+                    budget_per_tonne, location, offset_percentage
                 )
-                
+
                 # Calculate total offset cost
                 total_cost = co.calculate_offset_cost(
                     emissions_to_offset, 
@@ -845,7 +1039,9 @@ with tab4:
                 
                 # Format and display recommendations
                 st.markdown("### Recommended Offset Projects")
-                st.markdown(co.format_offset_results_html(offset_recommendations), unsafe_allow_html=True)
+                st.markdown(_cached_offset_html(offset_scope_items, offset_cat_items, industry,
+                                                budget_per_tonne, location, offset_percentage),
+                            unsafe_allow_html=True)
                 
                 # Display disclaimer
                 st.markdown("""
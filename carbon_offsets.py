@@ -7,8 +7,11 @@ Provides tailored recommendations for carbon offset projects based on:
 - Budget considerations
 """
 
+import heapq
+
 import pandas as pd
 import numpy as np
+from types import MappingProxyType
 
 # Dictionary of verified carbon offset projects with detailed information
 CARBON_OFFSET_PROJECTS = {
@@ -129,6 +132,76 @@ CARBON_OFFSET_PROJECTS = {
     }
 }
 
+# Freeze the catalog: read-only views prevent accidental mutation of the
+# shared project dicts, so the recommendation paths no longer need a
+# defensive .copy() per call
+CARBON_OFFSET_PROJECTS = {pid: MappingProxyType(project)
+                          for pid, project in CARBON_OFFSET_PROJECTS.items()}
+
+# Precomputed scoring tables, built once at import so the per-request
+# scoring path is set membership plus ndarray arithmetic instead of
+# repeated list scans over the project dicts.
+PROJECT_IDS = list(CARBON_OFFSET_PROJECTS.keys())
+PRICE_MIN = np.array([CARBON_OFFSET_PROJECTS[p]["price_range"][0] for p in PROJECT_IDS])
+PRICE_MAX = np.array([CARBON_OFFSET_PROJECTS[p]["price_range"][1] for p in PROJECT_IDS])
+
+def _vocabulary_index(field):
+    """Map every distinct value of a project list field to a column id."""
+    values = sorted({value for p in PROJECT_IDS
+                     for value in CARBON_OFFSET_PROJECTS[p][field]})
+    return {value: i for i, value in enumerate(values)}
+
+def _membership_matrix(field, index):
+    """Build an int8 (project x vocabulary) membership matrix for a field."""
+    matrix = np.zeros((len(PROJECT_IDS), len(index)), dtype=np.int8)
+    for row, project_id in enumerate(PROJECT_IDS):
+        for value in CARBON_OFFSET_PROJECTS[project_id][field]:
+            matrix[row, index[value]] = 1
+    return matrix
+
+# The industry/scope/location vocabularies are closed sets, so string
+# membership tests reduce to integer column lookups against these matrices
+_INDUSTRY_IDX = _vocabulary_index("best_for_industries")
+_EMISSIONS_IDX = _vocabulary_index("best_for_emissions")
+_LOCATION_IDX = _vocabulary_index("project_locations")
+INDUSTRY_MATCH = _membership_matrix("best_for_industries", _INDUSTRY_IDX)
+EMISSIONS_MATCH = _membership_matrix("best_for_emissions", _EMISSIONS_IDX)
+LOCATION_MATCH = _membership_matrix("project_locations", _LOCATION_IDX)
+
+def _score_projects(industry, largest_scope, top_categories, location):
+    """
+    Score every project against the request profile in one pass.
+
+    Pure integer column arithmetic over the precomputed membership
+    matrices; values absent from a vocabulary simply contribute nothing.
+    """
+    scores = np.zeros(len(PROJECT_IDS), dtype=np.int32)
+
+    col = _INDUSTRY_IDX.get(industry)
+    if col is not None:
+        scores += 5 * INDUSTRY_MATCH[:, col]
+
+    scope_hit = np.zeros(len(PROJECT_IDS), dtype=np.int8)
+    for key in ("All scopes", largest_scope):
+        col = _EMISSIONS_IDX.get(key)
+        if col is not None:
+            scope_hit |= EMISSIONS_MATCH[:, col]
+    scores += 4 * scope_hit
+
+    for category in top_categories:
+        col = _EMISSIONS_IDX.get(category)
+        if col is not None:
+            scores += 3 * EMISSIONS_MATCH[:, col]
+
+    loc_hit = np.zeros(len(PROJECT_IDS), dtype=np.int8)
+    for key in ("Global", location):
+        col = _LOCATION_IDX.get(key)
+        if col is not None:
+            loc_hit |= LOCATION_MATCH[:, col]
+    scores += 2 * loc_hit
+
+    return scores
+
 # Constants for recommendation logic
 VERIFICATION_STANDARDS = {
     "Gold Standard": "The Gold Standard for the Global Goals (GS4GG) is a standard for climate and development interventions that enables quantification of climate impacts and verification of SDG outcomes.",
@@ -160,42 +233,28 @@ def get_offset_recommendations(emissions_by_scope, emissions_by_category, indust
     total_emissions = sum(emissions_by_scope.values())
     emissions_to_offset = total_emissions * (offset_percentage / 100)
     
-    # Initialize scores for each project
-    project_scores = {project_id: 0 for project_id in CARBON_OFFSET_PROJECTS.keys()}
-    
     # Score based on emissions profile (scope breakdown)
     largest_scope = max(emissions_by_scope.items(), key=lambda x: x[1])[0]
-    
-    # Score based on emissions categories
-    sorted_categories = sorted(emissions_by_category.items(), key=lambda x: x[1], reverse=True)
-    top_3_categories = [cat[0] for cat in sorted_categories[:3] if cat[1] > 0]
-    
-    # Calculate scores for each project
-    for project_id, project in CARBON_OFFSET_PROJECTS.items():
-        # Budget filter
-        if budget_per_tonne and project["price_range"][0] > budget_per_tonne:
-            continue
-            
-        # Industry match
-        if industry in project["best_for_industries"]:
-            project_scores[project_id] += 5
-            
-        # Emissions scope match
-        if largest_scope in project["best_for_emissions"] or "All scopes" in project["best_for_emissions"]:
-            project_scores[project_id] += 4
-            
-        # Emissions category match
-        for category in top_3_categories:
-            if category in project["best_for_emissions"]:
-                project_scores[project_id] += 3
-                
-        # Location match
-        if location in project["project_locations"] or "Global" in project["project_locations"]:
-            project_scores[project_id] += 2
-            
-    # Get top recommendations
-    recommended_projects = sorted([(project_id, score) for project_id, score in project_scores.items() if score > 0], 
-                                 key=lambda x: x[1], reverse=True)
+
+    # Score based on the top emissions categories; only the top 3 are
+    # needed, so a bounded heap selection beats a full sort
+    top_3_categories = [category for category, value
+                        in heapq.nlargest(3, emissions_by_category.items(), key=lambda kv: kv[1])
+                        if value > 0]
+
+    # Calculate scores against the precomputed membership matrices
+    scores = _score_projects(industry, largest_scope, top_3_categories, location)
+
+    # Budget filter: zero out projects whose cheapest price exceeds the budget
+    if budget_per_tonne:
+        scores[PRICE_MIN > budget_per_tonne] = 0
+
+    # Get top recommendations straight off the score vector: mask out the
+    # zero scores, then order the survivors descending (stable, so ties
+    # keep project-table order like the old sorted() did)
+    matched = np.where(scores > 0)[0]
+    order = matched[np.argsort(-scores[matched], kind='stable')]
+    recommended_projects = [(PROJECT_IDS[i], int(scores[i])) for i in order]
     
     # Format recommendations with portfolio approach
     portfolio_recommendations = []
@@ -205,30 +264,28 @@ def get_offset_recommendations(emissions_by_scope, emissions_by_category, indust
         # If no projects match the criteria, return general recommendations
         return get_general_recommendations(emissions_to_offset, budget_per_tonne)
     
-    for project_id, score in recommended_projects[:4]:  # Top 4 projects for a portfolio
-        project = CARBON_OFFSET_PROJECTS[project_id].copy()
-        
-        # Calculate suggested allocation percentage based on score relative to total scores
-        total_score = sum([score for _, score in recommended_projects[:4]])
-        allocation_percentage = (score / total_score) * 100 if total_score > 0 else 25
-        
-        # Calculate tonnes to offset with this project
-        tonnes_to_offset = (allocation_percentage / 100) * emissions_to_offset
-        
-        # Calculate cost range
-        min_cost = tonnes_to_offset * project["price_range"][0]
-        max_cost = tonnes_to_offset * project["price_range"][1]
-        
-        project.update({
+    # Top 4 projects for a portfolio: compute allocations, tonnage and
+    # cost ranges in one shot against the precomputed price arrays
+    top_idx = order[:4]
+    scores_top = scores[top_idx].astype(np.float64)
+    total_score = scores_top.sum() or 1.0
+    allocations = scores_top / total_score * 100
+    tonnes_vec = (allocations / 100) * emissions_to_offset
+    costs_lo = tonnes_vec * PRICE_MIN[top_idx]
+    costs_hi = tonnes_vec * PRICE_MAX[top_idx]
+
+    for i, proj_idx in enumerate(top_idx):
+        project_id = PROJECT_IDS[proj_idx]
+
+        portfolio_recommendations.append({
+            **CARBON_OFFSET_PROJECTS[project_id],
             "id": project_id,
-            "score": score,
-            "allocation_percentage": round(allocation_percentage, 1),
-            "tonnes_to_offset": round(tonnes_to_offset, 2),
-            "cost_range": (round(min_cost, 2), round(max_cost, 2))
+            "score": int(scores[proj_idx]),
+            "allocation_percentage": round(float(allocations[i]), 1),
+            "tonnes_to_offset": round(float(tonnes_vec[i]), 2),
+            "cost_range": (round(float(costs_lo[i]), 2), round(float(costs_hi[i]), 2))
         })
         
-        portfolio_recommendations.append(project)
-        
     return {
         "total_emissions": total_emissions,
         "emissions_to_offset": emissions_to_offset,
@@ -252,25 +309,24 @@ def get_general_recommendations(emissions_to_offset, budget_per_tonne=None):
     portfolio_recommendations = []
     
     for project_id in diverse_projects:
-        project = CARBON_OFFSET_PROJECTS[project_id].copy()
-        
+        base = CARBON_OFFSET_PROJECTS[project_id]
+
         # Equal allocation among projects
         allocation_percentage = 100 / len(diverse_projects)
         tonnes_to_offset = (allocation_percentage / 100) * emissions_to_offset
-        
+
         # Calculate cost range
-        min_cost = tonnes_to_offset * project["price_range"][0]
-        max_cost = tonnes_to_offset * project["price_range"][1]
-        
-        project.update({
+        min_cost = tonnes_to_offset * base["price_range"][0]
+        max_cost = tonnes_to_offset * base["price_range"][1]
+
+        portfolio_recommendations.append({
+            **base,
             "id": project_id,
             "score": "N/A",
             "allocation_percentage": round(allocation_percentage, 1),
             "tonnes_to_offset": round(tonnes_to_offset, 2),
             "cost_range": (round(min_cost, 2), round(max_cost, 2))
         })
-        
-        portfolio_recommendations.append(project)
     
     return {
         "total_emissions": emissions_to_offset,
@@ -295,56 +351,71 @@ def calculate_offset_cost(emissions, price_per_tonne=15, offset_percentage=100):
     emissions_to_offset = emissions * (offset_percentage / 100)
     return round(emissions_to_offset * price_per_tonne, 2)
 
+# Per-project HTML block, parsed once at import instead of re-built as an
+# f-string template on every render
+_PROJECT_HTML_TEMPLATE = """
+        <div style="margin-bottom: 15px; padding: 10px; border-left: 4px solid #4CAF50; background-color: white;">
+            <h5>{name} ({allocation_percentage}% of portfolio)</h5>
+            <p>{description}</p>
+            <p><strong>Verification Standards:</strong> {verification}</p>
+            <p><strong>Co-benefits:</strong> {co_benefits}</p>
+            <p><strong>Project Locations:</strong> {locations}</p>
+            <p><strong>Recommended Allocation:</strong> {tonnes_to_offset:.2f} tonnes CO₂e</p>
+            <p><strong>Estimated Cost:</strong> ${cost_lo:,.2f} - ${cost_hi:,.2f}</p>
+        </div>
+        """
+
+# The verification-standards tail is identical for every render, so the
+# whole block is assembled once at import
+_STANDARDS_HTML = """
+        <hr style="margin: 15px 0;">
+        <h4>About Carbon Offset Verification Standards</h4>
+        <p>Verification standards ensure the quality, additionality, and real impact of offset projects:</p>
+    """ + ''.join(f"""
+        <div style="margin-bottom: 10px;">
+            <p><strong>{standard}:</strong> {description}</p>
+        </div>
+        """ for standard, description in VERIFICATION_STANDARDS.items())
+
 def format_offset_results_html(recommendations):
     """
     Format offset recommendations as HTML for display in Streamlit
     """
-    html = f"""
+    parts = [f"""
     <div style="background-color: #f8f9fa; padding: 15px; border-radius: 10px;">
         <h3>Carbon Offset Portfolio Recommendation</h3>
         <p>Total emissions: {recommendations['total_emissions']:.2f} tonnes CO₂e</p>
         <p>Emissions to offset: {recommendations['emissions_to_offset']:.2f} tonnes CO₂e</p>
-        
+
         <hr style="margin: 15px 0;">
-        
+
         <h4>Recommended Portfolio of Carbon Offset Projects</h4>
         <p>We recommend a diverse portfolio approach to maximize co-benefits and reduce risk:</p>
-    """
-    
+    """]
+
     for project in recommendations['portfolio_approach']:
-        html += f"""
-        <div style="margin-bottom: 15px; padding: 10px; border-left: 4px solid #4CAF50; background-color: white;">
-            <h5>{project['name']} ({project['allocation_percentage']}% of portfolio)</h5>
-            <p>{project['description']}</p>
-            <p><strong>Verification Standards:</strong> {', '.join(project['verification_standards'])}</p>
-            <p><strong>Co-benefits:</strong> {', '.join(project['co_benefits'])}</p>
-            <p><strong>Project Locations:</strong> {', '.join(project['project_locations'])}</p>
-            <p><strong>Recommended Allocation:</strong> {project['tonnes_to_offset']:.2f} tonnes CO₂e</p>
-            <p><strong>Estimated Cost:</strong> ${project['cost_range'][0]:,.2f} - ${project['cost_range'][1]:,.2f}</p>
-        </div>
-        """
-    
-    html += """
-        <hr style="margin: 15px 0;">
-        <h4>About Carbon Offset Verification Standards</h4>
-        <p>Verification standards ensure the quality, additionality, and real impact of offset projects:</p>
-    """
-    
-    for standard, description in recommendations['verification_standards'].items():
-        html += f"""
-        <div style="margin-bottom: 10px;">
-            <p><strong>{standard}:</strong> {description}</p>
-        </div>
-        """
-    
+        parts.append(_PROJECT_HTML_TEMPLATE.format(
+            name=project['name'],
+            allocation_percentage=project['allocation_percentage'],
+            description=project['description'],
+            verification=', '.join(project['verification_standards']),
+            co_benefits=', '.join(project['co_benefits']),
+            locations=', '.join(project['project_locations']),
+            tonnes_to_offset=project['tonnes_to_offset'],
+            cost_lo=project['cost_range'][0],
+            cost_hi=project['cost_range'][1]
+        ))
+
+    parts.append(_STANDARDS_HTML)
+
     if 'note' in recommendations:
-        html += f"""
+        parts.append(f"""
         <div style="margin-top: 15px; padding: 10px; background-color: #fff3cd; border-left: 4px solid #ffc107;">
             <p><strong>Note:</strong> {recommendations['note']}</p>
         </div>
-        """
-    
-    html += """
+        """)
+
+    parts.append("""
     </div>
-    """
-    return html
\ No newline at end of file
+    """)
+    return ''.join(parts)
\ No newline at end of file
@@ -1,19 +1,23 @@
 """
 Database module for Carbon Footprint Calculator
 """
+import functools
 import os
 import datetime
 import pandas as pd
-from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, Boolean, Text, JSON
+from sqlalchemy import create_engine, select, insert, func, cast, Index, Column, Integer, Float, String, DateTime, Boolean, Text, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
 
 # Get database URL from environment
 DATABASE_URL = os.environ.get('DATABASE_URL')
 
-# Create SQLAlchemy engine and session
-engine = create_engine(DATABASE_URL)
-Session = sessionmaker(bind=engine)
+# Create SQLAlchemy engine and session factory. The engine pools
+# connections (pre-pinged so stale ones are recycled) and the scoped
+# session is shared per thread instead of being rebuilt per call.
+engine = create_engine(DATABASE_URL, pool_size=5, max_overflow=10, pool_pre_ping=True)
+Session = scoped_session(sessionmaker(bind=engine, expire_on_commit=False))
 Base = declarative_base()
 
 class CarbonFootprint(Base):
@@ -21,6 +25,15 @@ class CarbonFootprint(Base):
     Model for storing carbon footprint calculation results
     """
     __tablename__ = 'carbon_footprint'
+    __table_args__ = (
+        # History listings are served newest-first with LIMIT/OFFSET
+        Index('ix_cf_created_at', 'created_at'),
+        # History filters by reporting year and/or industry
+        Index('ix_cf_year_industry', 'reporting_year', 'industry'),
+        # GIN index over the raw inputs for future containment queries
+        # (Postgres only; other backends just ignore the USING clause)
+        Index('ix_cf_input_gin', 'input_data', postgresql_using='gin'),
+    )
 
     id = Column(Integer, primary_key=True)
     
@@ -39,15 +52,20 @@ class CarbonFootprint(Base):
     scope2_emissions = Column(Float)
     scope3_emissions = Column(Float)
     
-    # Emissions by category (JSON for flexibility)
-    emissions_by_category = Column(JSON)
-    
+    # Emissions by category. JSONB on Postgres (binary-decoded once at
+    # insert rather than reparsed on every read); plain JSON elsewhere
+    emissions_by_category = Column(JSON().with_variant(JSONB, 'postgresql'))
+
     # Input data (for reference)
-    input_data = Column(JSON)
+    input_data = Column(JSON().with_variant(JSONB, 'postgresql'))
 
+@functools.cache
 def init_db():
     """
-    Initialize the database by creating all tables
+    Initialize the database by creating all tables.
+
+    Cached so repeated calls (e.g. once per Streamlit session) only hit
+    the database with metadata queries the first time per process.
     """
     Base.metadata.create_all(engine)
 
@@ -77,8 +95,6 @@ def save_carbon_footprint(
     Returns:
     - id: ID of the saved record
     """
-    session = Session()
-    
     # Create new record
     footprint = CarbonFootprint(
         organization_name=organization_name,
@@ -92,51 +108,134 @@ def save_carbon_footprint(
         emissions_by_category=emissions_by_category,
         input_data=input_data
     )
-    
-    # Add and commit
-    session.add(footprint)
-    session.commit()
-    
-    # Get ID
-    record_id = footprint.id
-    
-    # Close session
-    session.close()
-    
-    return record_id
 
-def get_all_footprints():
+    # Add and commit; the context managers roll back and release the
+    # connection on error instead of leaking it
+    with Session() as session, session.begin():
+        session.add(footprint)
+
+    return footprint.id
+
+def save_carbon_footprints_bulk(records):
     """
-    Get all carbon footprint records
-    
+    Save many carbon footprint records in a single INSERT
+
+    Parameters:
+    - records: List of dicts keyed by CarbonFootprint column names
+      (e.g. from a historical import)
+
     Returns:
-    - DataFrame with all records
+    - Number of records inserted
     """
-    session = Session()
-    
-    # Query all records
-    footprints = session.query(CarbonFootprint).all()
-    
-    # Convert to list of dicts
-    results = []
-    for fp in footprints:
-        results.append({
-            "id": fp.id,
-            "organization_name": fp.organization_name,
-            "industry": fp.industry,
-            "reporting_year": fp.reporting_year,
-            "created_at": fp.created_at,
-            "total_emissions": fp.total_emissions,
-            "scope1_emissions": fp.scope1_emissions,
-            "scope2_emissions": fp.scope2_emissions,
-            "scope3_emissions": fp.scope3_emissions
-        })
-    
-    # Close session
-    session.close()
-    
-    # Return as DataFrame
-    return pd.DataFrame(results)
+    if not records:
+        return 0
+
+    # Plain-dict executemany path: one round-trip, no ORM objects
+    with Session() as session, session.begin():
+        session.execute(insert(CarbonFootprint), records)
+
+    return len(records)
+
+def get_all_footprints(limit=None, offset=0):
+    """
+    Get carbon footprint records, newest first
+
+    Parameters:
+    - limit: Maximum number of records to return (None for all)
+    - offset: Number of records to skip, for pagination
+
+    Returns:
+    - DataFrame with the selected records
+    """
+    # Select only the scalar listing columns; this avoids hydrating ORM
+    # objects and deserializing the JSON columns just to discard them
+    stmt = select(
+        CarbonFootprint.id,
+        CarbonFootprint.organization_name,
+        CarbonFootprint.industry,
+        CarbonFootprint.reporting_year,
+        CarbonFootprint.created_at,
+        CarbonFootprint.total_emissions,
+        CarbonFootprint.scope1_emissions,
+        CarbonFootprint.scope2_emissions,
+        CarbonFootprint.scope3_emissions
+    ).order_by(CarbonFootprint.created_at.desc())
+
+    if limit is not None:
+        stmt = stmt.limit(limit).offset(offset)
+
+    with engine.connect() as conn:
+        return pd.read_sql(stmt, conn)
+
+def get_footprints_filtered(year=None, industry=None, limit=50, offset=0):
+    """
+    Get carbon footprint records filtered by year and/or industry, newest first
+
+    Parameters:
+    - year: Reporting year to filter on (None for all years)
+    - industry: Industry to filter on (None for all industries)
+    - limit: Maximum number of records to return (None for all)
+    - offset: Number of records to skip, for pagination
+
+    Returns:
+    - DataFrame with the matching records
+    """
+    stmt = select(
+        CarbonFootprint.id,
+        CarbonFootprint.organization_name,
+        CarbonFootprint.industry,
+        CarbonFootprint.reporting_year,
+        CarbonFootprint.created_at,
+        CarbonFootprint.total_emissions,
+        CarbonFootprint.scope1_emissions,
+        CarbonFootprint.scope2_emissions,
+        CarbonFootprint.scope3_emissions
+    )
+
+    # Conditional WHERE clauses keep the statement index-friendly: only
+    # the filters actually supplied end up in the query
+    if year is not None:
+        stmt = stmt.where(CarbonFootprint.reporting_year == year)
+    if industry is not None:
+        stmt = stmt.where(CarbonFootprint.industry == industry)
+
+    stmt = stmt.order_by(CarbonFootprint.created_at.desc())
+
+    if limit is not None:
+        stmt = stmt.limit(limit).offset(offset)
+
+    with engine.connect() as conn:
+        return pd.read_sql(stmt, conn)
+
+def get_footprint_summary():
+    """
+    Get the comparison roll-up (label, industry, total and per-scope
+    emissions) with the display label computed in SQL
+
+    Returns:
+    - DataFrame with one row per saved footprint, newest first
+    """
+    label = (CarbonFootprint.organization_name + ' ('
+             + cast(CarbonFootprint.reporting_year, String) + ')').label('label')
+    stmt = select(
+        CarbonFootprint.id,
+        label,
+        CarbonFootprint.industry,
+        CarbonFootprint.total_emissions,
+        CarbonFootprint.scope1_emissions,
+        CarbonFootprint.scope2_emissions,
+        CarbonFootprint.scope3_emissions
+    ).order_by(CarbonFootprint.created_at.desc())
+
+    with engine.connect() as conn:
+        return pd.read_sql(stmt, conn)
+
+def count_footprints():
+    """
+    Count all saved carbon footprint records, for pagination UI
+    """
+    with engine.connect() as conn:
+        return conn.execute(select(func.count(CarbonFootprint.id))).scalar()
 
 def get_footprint_by_id(record_id):
     """
@@ -148,35 +247,25 @@ def get_footprint_by_id(record_id):
     Returns:
     - Dictionary with record data or None if not found
     """
-    session = Session()
-    
-    # Query the record
-    footprint = session.query(CarbonFootprint).filter(CarbonFootprint.id == record_id).first()
-    
-    # If not found, return None
-    if not footprint:
-        session.close()
-        return None
-    
-    # Convert to dict
-    result = {
-        "id": footprint.id,
-        "organization_name": footprint.organization_name,
-        "industry": footprint.industry,
-        "reporting_year": footprint.reporting_year,
-        "created_at": footprint.created_at,
-        "total_emissions": footprint.total_emissions,
-        "scope1_emissions": footprint.scope1_emissions,
-        "scope2_emissions": footprint.scope2_emissions,
-        "scope3_emissions": footprint.scope3_emissions,
-        "emissions_by_category": footprint.emissions_by_category,
-        "input_data": footprint.input_data
-    }
-    
-    # Close session
-    session.close()
-    
-    return result
+    with Session() as session:
+        # Query the record
+        footprint = session.query(CarbonFootprint).filter(CarbonFootprint.id == record_id).first()
+
+        # If not found, return None
+        if not footprint:
+            return None
 
-# Initialize the database when this module is imported
-init_db()
\ No newline at end of file
+        # Convert to dict
+        return {
+            "id": footprint.id,
+            "organization_name": footprint.organization_name,
+            "industry": footprint.industry,
+            "reporting_year": footprint.reporting_year,
+            "created_at": footprint.created_at,
+            "total_emissions": footprint.total_emissions,
+            "scope1_emissions": footprint.scope1_emissions,
+            "scope2_emissions": footprint.scope2_emissions,
+            "scope3_emissions": footprint.scope3_emissions,
+            "emissions_by_category": footprint.emissions_by_category,
+            "input_data": footprint.input_data
+        }
\ No newline at end of file
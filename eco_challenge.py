@@ -6,55 +6,161 @@ on social media platforms.
 
 import streamlit as st
 import base64
+from functools import lru_cache
 from urllib.parse import quote
 
+@lru_cache(maxsize=128)
+def _quote_cached(text):
+    """URL-encode a string, memoized since messages repeat across reruns."""
+    return quote(text)
+
+# Challenge catalog, allocated once at import. Tuples keep the option
+# lists immutable so reruns never re-create them.
+CHALLENGE_OPTIONS = {
+    "Energy": (
+        "Switch to 100% renewable energy",
+        "Reduce energy consumption by 20%",
+        "Install smart thermostats and energy-efficient lighting",
+        "Conduct an energy audit and implement recommendations",
+        "Other (custom)"
+    ),
+    "Transportation": (
+        "Commute by public transit, cycling, or walking",
+        "Transition to an electric or hybrid vehicle",
+        "Implement a car-free day each week",
+        "Reduce business air travel by 50%",
+        "Other (custom)"
+    ),
+    "Waste": (
+        "Achieve zero waste to landfill",
+        "Implement comprehensive recycling program",
+        "Eliminate single-use plastics",
+        "Compost all food and organic waste",
+        "Other (custom)"
+    ),
+    "Food": (
+        "Adopt a plant-based diet 3+ days per week",
+        "Source food locally to reduce transportation emissions",
+        "Reduce food waste by 50%",
+        "Choose organic and regenerative food options",
+        "Other (custom)"
+    ),
+    "Purchasing": (
+        "Implement sustainable procurement policies",
+        "Choose products with lower carbon footprints",
+        "Extend product lifecycles through repair and reuse",
+        "Support carbon-neutral companies and products",
+        "Other (custom)"
+    ),
+    "Water": (
+        "Reduce water consumption by 25%",
+        "Install water-efficient fixtures and appliances",
+        "Harvest rainwater for irrigation",
+        "Address water leaks and inefficiencies",
+        "Other (custom)"
+    ),
+    "Community": (
+        "Organize a community climate action event",
+        "Volunteer with environmental organizations",
+        "Advocate for climate policies with local representatives",
+        "Start a sustainability initiative at work or school",
+        "Other (custom)"
+    )
+}
+
+_TIMEFRAME_OPTIONS = ("1 month", "3 months", "6 months", "1 year", "Ongoing")
+
+# Per-platform URL templates; the message/url are quoted once and shared
+# across every platform instead of re-encoded per generate_share_url call
+_SHARE_TEMPLATES = {
+    "twitter": "https://twitter.com/intent/tweet?text={message}",
+    "linkedin": "https://www.linkedin.com/sharing/share-offsite/?url={url}&summary={message}",
+    "facebook": "https://www.facebook.com/sharer/sharer.php?u={url}&quote={message}",
+    "email": "mailto:?subject={subject}&body={message}"
+}
+_EMAIL_SUBJECT = quote("My Carbon Reduction Commitment")
+
+# Badge markup hoisted out of the display function so the ~900-byte
+# skeleton is parsed once at import and only the fields are substituted
+_BADGE_TEMPLATE = """
+        <div style="border: 2px solid #4CAF50; border-radius: 10px; padding: 20px; text-align: center; max-width: 400px; margin: 0 auto;">
+            <div style="font-size: 48px; margin-bottom: 10px;">{icon}</div>
+            <h3 style="margin: 5px 0;">{challenge_type} Eco-Challenge</h3>
+            <p style="font-style: italic; margin: 5px 0;">Committed by: {name}</p>
+            <p style="margin: 10px 0;">"{challenge_description}"</p>
+            <p style="margin: 5px 0; font-size: 0.9em;">Reducing approximately {emissions_reduced:.2f} tonnes CO₂e</p>
+            <p style="margin: 5px 0; font-size: 0.9em;">Timeframe: {timeframe}</p>
+            <div style="background-color: #4CAF50; color: white; padding: 5px; margin-top: 15px; border-radius: 5px;">
+                Climate Action Champion
+            </div>
+        </div>
+        """
+
+def generate_share_urls(message, url=None):
+    """
+    Generate sharing URLs for all supported platforms in one pass
+
+    Parameters:
+    - message: Message to share
+    - url: URL to include in the share (optional)
+
+    Returns:
+    - Dictionary mapping platform name to its sharing URL
+    """
+    ctx = {
+        "message": _quote_cached(message),
+        "url": _quote_cached(url) if url else "",
+        "subject": _EMAIL_SUBJECT
+    }
+    return {platform: template.format_map(ctx)
+            for platform, template in _SHARE_TEMPLATES.items()}
+
 def generate_share_url(platform, message, url=None):
     """
-    Generate sharing URLs for different social media platforms
-    
+    Generate a sharing URL for a single social media platform
+
     Parameters:
     - platform: Social media platform (twitter, linkedin, facebook, email)
     - message: Message to share
     - url: URL to include in the share (optional)
-    
+
     Returns:
     - URL for sharing on the specified platform
     """
-    encoded_message = quote(message)
-    
-    if platform == "twitter":
-        return f"https://twitter.com/intent/tweet?text={encoded_message}"
-    elif platform == "linkedin":
-        return f"https://www.linkedin.com/sharing/share-offsite/?url={quote(url) if url else ''}&summary={encoded_message}"
-    elif platform == "facebook":
-        return f"https://www.facebook.com/sharer/sharer.php?u={quote(url) if url else ''}&quote={encoded_message}"
-    elif platform == "email":
-        subject = quote("My Carbon Reduction Commitment")
-        return f"mailto:?subject={subject}&body={encoded_message}"
-    return "#"
+    template = _SHARE_TEMPLATES.get(platform)
+    if template is None:
+        return "#"
+    return template.format_map({
+        "message": _quote_cached(message),
+        "url": _quote_cached(url) if url else "",
+        "subject": _EMAIL_SUBJECT
+    })
+
+# Challenge-type icons, allocated once at import
+_ICONS = {
+    "Energy": "⚡",
+    "Transportation": "🚗",
+    "Waste": "♻️",
+    "Food": "🥗",
+    "Purchasing": "🛍️",
+    "Water": "💧",
+    "Community": "👪"
+}
 
 def get_challenge_icon(challenge_type):
     """
     Return an appropriate emoji icon for each challenge type
-    
+
     Parameters:
     - challenge_type: Type of challenge
-    
+
     Returns:
     - Emoji icon for the challenge type
     """
-    icons = {
-        "Energy": "⚡",
-        "Transportation": "🚗",
-        "Waste": "♻️",
-        "Food": "🥗",
-        "Purchasing": "🛍️",
-        "Water": "💧",
-        "Community": "👪"
-    }
-    return icons.get(challenge_type, "🌱")
+    return _ICONS.get(challenge_type, "🌱")
 
-def generate_challenge_message(name, organization, challenge_type, challenge_description, 
+@st.cache_data(max_entries=128, show_spinner=False)
+def generate_challenge_message(name, organization, challenge_type, challenge_description,
                                emissions_reduced, timeframe):
     """
     Generate a message for sharing on social media
@@ -71,27 +177,21 @@ def generate_challenge_message(name, organization, challenge_type, challenge_des
     - Formatted message for social media sharing
     """
     icon = get_challenge_icon(challenge_type)
-    
-    # Format the message
-    message = f"I just committed to the {icon} {challenge_type} Eco-Challenge!\n\n"
-    
-    if organization:
-        message += f"At {organization}, "
-    else:
-        message += "I "
-        
-    message += f"commit to: {challenge_description}\n\n"
-    
-    if emissions_reduced:
-        message += f"This will help reduce approximately {emissions_reduced:.2f} tonnes CO₂e "
-        if timeframe:
-            message += f"over {timeframe}.\n\n"
-        else:
-            message += "annually.\n\n"
-    
-    message += "Join me in taking climate action! Calculate your carbon footprint and make your own commitment."
-    
-    return message
+
+    # Format the message as one f-string instead of incremental
+    # concatenation; the optional pieces collapse to empty strings
+    committer = f"At {organization}, " if organization else "I "
+    reduction = (
+        f"This will help reduce approximately {emissions_reduced:.2f} tonnes CO₂e "
+        f"{f'over {timeframe}.' if timeframe else 'annually.'}\n\n"
+    ) if emissions_reduced else ""
+
+    return (
+        f"I just committed to the {icon} {challenge_type} Eco-Challenge!\n\n"
+        f"{committer}commit to: {challenge_description}\n\n"
+        f"{reduction}"
+        "Join me in taking climate action! Calculate your carbon footprint and make your own commitment."
+    )
 
 def generate_challenge_image(name, challenge_type, challenge_description):
     """
@@ -115,69 +215,11 @@ def display_eco_challenge_tab():
     # Challenge selection
     st.subheader("1. Select Your Challenge")
     
-    challenge_type = st.selectbox(
-        "Challenge Category",
-        ["Energy", "Transportation", "Waste", "Food", "Purchasing", "Water", "Community"]
-    )
-    
+    challenge_type = st.selectbox("Challenge Category", tuple(CHALLENGE_OPTIONS))
+
     # Challenge options based on type
-    if challenge_type == "Energy":
-        challenge_options = [
-            "Switch to 100% renewable energy",
-            "Reduce energy consumption by 20%",
-            "Install smart thermostats and energy-efficient lighting",
-            "Conduct an energy audit and implement recommendations",
-            "Other (custom)"
-        ]
-    elif challenge_type == "Transportation":
-        challenge_options = [
-            "Commute by public transit, cycling, or walking",
-            "Transition to an electric or hybrid vehicle",
-            "Implement a car-free day each week",
-            "Reduce business air travel by 50%",
-            "Other (custom)"
-        ]
-    elif challenge_type == "Waste":
-        challenge_options = [
-            "Achieve zero waste to landfill",
-            "Implement comprehensive recycling program",
-            "Eliminate single-use plastics",
-            "Compost all food and organic waste",
-            "Other (custom)"
-        ]
-    elif challenge_type == "Food":
-        challenge_options = [
-            "Adopt a plant-based diet 3+ days per week",
-            "Source food locally to reduce transportation emissions",
-            "Reduce food waste by 50%",
-            "Choose organic and regenerative food options",
-            "Other (custom)"
-        ]
-    elif challenge_type == "Purchasing":
-        challenge_options = [
-            "Implement sustainable procurement policies",
-            "Choose products with lower carbon footprints",
-            "Extend product lifecycles through repair and reuse",
-            "Support carbon-neutral companies and products",
-            "Other (custom)"
-        ]
-    elif challenge_type == "Water":
-        challenge_options = [
-            "Reduce water consumption by 25%",
-            "Install water-efficient fixtures and appliances",
-            "Harvest rainwater for irrigation",
-            "Address water leaks and inefficiencies",
-            "Other (custom)"
-        ]
-    elif challenge_type == "Community":
-        challenge_options = [
-            "Organize a community climate action event",
-            "Volunteer with environmental organizations",
-            "Advocate for climate policies with local representatives",
-            "Start a sustainability initiative at work or school",
-            "Other (custom)"
-        ]
-    
+    challenge_options = CHALLENGE_OPTIONS[challenge_type]
+
     selected_challenge = st.selectbox("Select Challenge", challenge_options)
     
     if selected_challenge == "Other (custom)":
@@ -196,52 +238,51 @@ def display_eco_challenge_tab():
         organization = st.text_input("Organization (optional)")
     
     with col2:
-        timeframe_options = ["1 month", "3 months", "6 months", "1 year", "Ongoing"]
-        timeframe = st.selectbox("Commitment Timeframe", timeframe_options)
+        timeframe = st.selectbox("Commitment Timeframe", _TIMEFRAME_OPTIONS)
         emissions_reduced = st.number_input("Estimated Emissions Reduction (tonnes CO₂e)", 
                                           min_value=0.0, value=1.0, step=0.1)
     
     # Preview commitment
     st.subheader("3. Preview Your Commitment")
-    
-    if challenge_description:
-        preview_message = generate_challenge_message(
-            name, organization, challenge_type, challenge_description, 
+
+    # Skip all message/badge building until the inputs are usable; the
+    # empty state reruns on every keystroke
+    if not (name and challenge_description):
+        st.info("Fill in your name and challenge details to see the preview and sharing options.")
+        share_message = ""
+    else:
+        # Build the commitment message once and reuse it for the
+        # preview, the share links and the clipboard box
+        share_message = generate_challenge_message(
+            name, organization, challenge_type, challenge_description,
             emissions_reduced, timeframe
         )
-        
+
         with st.expander("Preview", expanded=True):
             st.markdown(f"**Your Eco-Challenge Commitment:**")
-            st.markdown(preview_message)
-    
+            st.markdown(share_message)
+
     # Share options
     st.subheader("4. Share Your Commitment")
-    
-    if not challenge_description or not name:
+
+    if not share_message:
         st.warning("Please complete your challenge details and name to enable sharing options.")
     else:
-        share_message = generate_challenge_message(
-            name, organization, challenge_type, challenge_description, 
-            emissions_reduced, timeframe
-        )
-        
+        share_urls = generate_share_urls(share_message)
+
         col1, col2, col3, col4 = st.columns(4)
-        
+
         with col1:
-            twitter_url = generate_share_url("twitter", share_message)
-            st.markdown(f"<a href='{twitter_url}' target='_blank' class='share-button twitter-button'>Twitter</a>", unsafe_allow_html=True)
-        
+            st.markdown(f"<a href='{share_urls['twitter']}' target='_blank' class='share-button twitter-button'>Twitter</a>", unsafe_allow_html=True)
+
         with col2:
-            linkedin_url = generate_share_url("linkedin", share_message)
-            st.markdown(f"<a href='{linkedin_url}' target='_blank' class='share-button linkedin-button'>LinkedIn</a>", unsafe_allow_html=True)
-        
+            st.markdown(f"<a href='{share_urls['linkedin']}' target='_blank' class='share-button linkedin-button'>LinkedIn</a>", unsafe_allow_html=True)
+
         with col3:
-            facebook_url = generate_share_url("facebook", share_message)
-            st.markdown(f"<a href='{facebook_url}' target='_blank' class='share-button facebook-button'>Facebook</a>", unsafe_allow_html=True)
-        
+            st.markdown(f"<a href='{share_urls['facebook']}' target='_blank' class='share-button facebook-button'>Facebook</a>", unsafe_allow_html=True)
+
         with col4:
-            email_url = generate_share_url("email", share_message)
-            st.markdown(f"<a href='{email_url}' target='_blank' class='share-button email-button'>Email</a>", unsafe_allow_html=True)
+            st.markdown(f"<a href='{share_urls['email']}' target='_blank' class='share-button email-button'>Email</a>", unsafe_allow_html=True)
         
         # Copy to clipboard option
         st.markdown("### Copy to Clipboard")
@@ -252,26 +293,18 @@ def display_eco_challenge_tab():
         st.markdown("### Your Eco-Challenge Badge")
         
         # Simple badge display
-        badge_html = f"""
-        <div style="border: 2px solid #4CAF50; border-radius: 10px; padding: 20px; text-align: center; max-width: 400px; margin: 0 auto;">
-            <div style="font-size: 48px; margin-bottom: 10px;">{get_challenge_icon(challenge_type)}</div>
-            <h3 style="margin: 5px 0;">{challenge_type} Eco-Challenge</h3>
-            <p style="font-style: italic; margin: 5px 0;">Committed by: {name}</p>
-            <p style="margin: 10px 0;">"{challenge_description}"</p>
-            <p style="margin: 5px 0; font-size: 0.9em;">Reducing approximately {emissions_reduced:.2f} tonnes CO₂e</p>
-            <p style="margin: 5px 0; font-size: 0.9em;">Timeframe: {timeframe}</p>
-            <div style="background-color: #4CAF50; color: white; padding: 5px; margin-top: 15px; border-radius: 5px;">
-                Climate Action Champion
-            </div>
-        </div>
-        """
+        badge_html = _BADGE_TEMPLATE.format(
+            icon=get_challenge_icon(challenge_type),
+            challenge_type=challenge_type,
+            name=name,
+            challenge_description=challenge_description,
+            emissions_reduced=emissions_reduced,
+            timeframe=timeframe
+        )
         st.markdown(badge_html, unsafe_allow_html=True)
 
-def add_eco_challenge_css():
-    """
-    Add CSS for the Eco-Challenge tab
-    """
-    st.markdown("""
+# Static CSS payload for the Eco-Challenge tab (built once at import)
+_ECO_CHALLENGE_CSS = """
     <style>
     .share-button {
         display: inline-block;
@@ -300,4 +333,17 @@ def add_eco_challenge_css():
         opacity: 0.9;
     }
     </style>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    """
+
+def get_eco_challenge_css():
+    """
+    Return the Eco-Challenge CSS payload without injecting it, so callers
+    can cache or batch the markdown dispatch themselves.
+    """
+    return _ECO_CHALLENGE_CSS
+
+def add_eco_challenge_css():
+    """
+    Add CSS for the Eco-Challenge tab
+    """
+    st.markdown(_ECO_CHALLENGE_CSS, unsafe_allow_html=True)
\ No newline at end of file
@@ -6,6 +6,59 @@ import streamlit as st
 import json
 import base64
 
+# Embed snippet skeletons, hoisted so each rerun only substitutes the
+# handful of fields instead of rebuilding the full literals
+_IFRAME_TMPL = """<iframe
+    src="{url}?embed=true&theme={theme}&showBranding={sb}"
+    width="{w}"
+    height="{h}"
+    style="border: 1px solid #ddd; border-radius: 8px; box-shadow: 0 4px 8px rgba(0,0,0,0.1);"
+    allow="camera; microphone; autoplay; encrypted-media; fullscreen; geolocation"
+    frameborder="0"
+    scrolling="auto"
+></iframe>"""
+
+_JS_TMPL = """<div id="carbon-footprint-calculator"></div>
+<script>
+    (function() {{
+        var iframe = document.createElement('iframe');
+        iframe.src = "{url}?embed=true&theme={theme}&showBranding={sb}";
+        iframe.width = "{w}";
+        iframe.height = "{h}";
+        iframe.style = "border: 1px solid #ddd; border-radius: 8px; box-shadow: 0 4px 8px rgba(0,0,0,0.1);";
+        iframe.allow = "camera; microphone; autoplay; encrypted-media; fullscreen; geolocation";
+        iframe.frameBorder = "0";
+        iframe.scrolling = "auto";
+
+        document.getElementById('carbon-footprint-calculator').appendChild(iframe);
+    }})();
+</script>"""
+
+_PREVIEW_IFRAME_TMPL = """
+            <iframe
+                src="{url}?embed=true&theme={theme}&showBranding={sb}"
+                width="{w}"
+                height="{h}"
+                style="border: 1px solid #ddd; border-radius: 8px; box-shadow: 0 4px 8px rgba(0,0,0,0.1);"
+                frameborder="0"
+                scrolling="auto"
+            ></iframe>
+            """
+
+_MOCK_PREVIEW_TMPL = """
+        <div style="width: {w}px; height: {h}px; border: 1px solid #ddd; border-radius: 8px;
+        background-color: {bg};
+        color: {fg};
+        display: flex; align-items: center; justify-content: center; font-family: sans-serif;">
+        <div style="text-align: center;">
+            <h3>Carbon Footprint Calculator</h3>
+            <p>This is a preview of how the embedded calculator will appear.</p>
+            <p>The actual embedded version will be fully functional.</p>
+            {branding}
+        </div>
+        </div>
+        """
+
 def main():
     st.title("Carbon Footprint Calculator - Embed Generator")
     st.write("Use this page to generate embed code for the Carbon Footprint Calculator that can be placed on any website.")
@@ -28,33 +81,20 @@ def main():
     if not app_url:
         st.warning("Please enter your Replit app URL. It should look something like 'https://your-app-name.replit.app'")
     
+    # One substitution context shared by every snippet
+    ctx = {
+        "url": app_url,
+        "theme": theme,
+        "sb": "true" if show_branding else "false",
+        "w": width,
+        "h": height
+    }
+
     # The iframe embed code
-    iframe_code = f"""<iframe 
-    src="{app_url}?embed=true&theme={theme}&showBranding={'true' if show_branding else 'false'}" 
-    width="{width}" 
-    height="{height}" 
-    style="border: 1px solid #ddd; border-radius: 8px; box-shadow: 0 4px 8px rgba(0,0,0,0.1);"
-    allow="camera; microphone; autoplay; encrypted-media; fullscreen; geolocation"
-    frameborder="0"
-    scrolling="auto"
-></iframe>"""
-    
+    iframe_code = _IFRAME_TMPL.format_map(ctx)
+
     # Alternative JavaScript embed method
-    js_code = f"""<div id="carbon-footprint-calculator"></div>
-<script>
-    (function() {{
-        var iframe = document.createElement('iframe');
-        iframe.src = "{app_url}?embed=true&theme={theme}&showBranding={'true' if show_branding else 'false'}";
-        iframe.width = "{width}";
-        iframe.height = "{height}";
-        iframe.style = "border: 1px solid #ddd; border-radius: 8px; box-shadow: 0 4px 8px rgba(0,0,0,0.1);";
-        iframe.allow = "camera; microphone; autoplay; encrypted-media; fullscreen; geolocation";
-        iframe.frameBorder = "0";
-        iframe.scrolling = "auto";
-        
-        document.getElementById('carbon-footprint-calculator').appendChild(iframe);
-    }})();
-</script>"""
+    js_code = _JS_TMPL.format_map(ctx)
     
     # Display the embed codes
     st.subheader("Embed Codes")
@@ -74,34 +114,19 @@ def main():
     # Display a live preview with an actual iframe
     if st.checkbox("Show live preview (may take a moment to load)", value=False):
         st.components.html(
-            f"""
-            <iframe 
-                src="{app_url}?embed=true&theme={theme}&showBranding={'true' if show_branding else 'false'}" 
-                width="{width}" 
-                height="{height}" 
-                style="border: 1px solid #ddd; border-radius: 8px; box-shadow: 0 4px 8px rgba(0,0,0,0.1);"
-                frameborder="0"
-                scrolling="auto"
-            ></iframe>
-            """,
+            _PREVIEW_IFRAME_TMPL.format_map(ctx),
             height=height+50,
             width=width+20,
         )
     else:
         # Display a mock preview
-        st.markdown(f"""
-        <div style="width: {width}px; height: {height}px; border: 1px solid #ddd; border-radius: 8px; 
-        background-color: {'#f9f9f9' if theme == 'light' else '#333'};
-        color: {'#333' if theme == 'light' else '#f9f9f9'};
-        display: flex; align-items: center; justify-content: center; font-family: sans-serif;">
-        <div style="text-align: center;">
-            <h3>Carbon Footprint Calculator</h3>
-            <p>This is a preview of how the embedded calculator will appear.</p>
-            <p>The actual embedded version will be fully functional.</p>
-            {('<div style="margin-top: 20px; font-size: 12px;">Powered by Your Company</div>' if show_branding else '')}
-        </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_MOCK_PREVIEW_TMPL.format(
+            w=width,
+            h=height,
+            bg='#f9f9f9' if theme == 'light' else '#333',
+            fg='#333' if theme == 'light' else '#f9f9f9',
+            branding='<div style="margin-top: 20px; font-size: 12px;">Powered by Your Company</div>' if show_branding else ''
+        ), unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -9,20 +9,57 @@ Primary sources:
 - DEFRA Conversion Factors
 """
 
+from typing import NamedTuple
+
+# The hot factor tables are NamedTuples rather than dicts: the field set
+# is fixed, so calculators fetch attributes instead of hashing string
+# keys, and the tuples feed straight into NumPy factor vectors.
+
+class StationaryCombustionFactors(NamedTuple):
+    natural_gas: float  # per m³
+    diesel: float       # per liter
+    propane: float      # per liter
+    fuel_oil: float     # per liter
+
+class MobileCombustionFactors(NamedTuple):
+    gasoline: float
+    diesel: float
+    jet_fuel: float
+
+class BusinessTravelFactors(NamedTuple):
+    air_short_haul: float
+    air_medium_haul: float
+    air_long_haul: float
+    car_rental: float
+    hotel_stay: float  # per night
+
+class CommutingFactors(NamedTuple):
+    car: float
+    carpool: float
+    public_transit: float
+    walking_biking: float
+    wfh: float  # Home office energy use
+
+class WasteFactors(NamedTuple):
+    landfill: float
+    recycled: float
+    composted: float
+    incinerated: float
+
 # Stationary Combustion (tonnes CO2e per unit)
-STATIONARY_COMBUSTION = {
-    'natural_gas': 0.00195,  # per m³
-    'diesel': 0.00273,       # per liter
-    'propane': 0.00153,      # per liter
-    'fuel_oil': 0.00281      # per liter
-}
+STATIONARY_COMBUSTION = StationaryCombustionFactors(
+    natural_gas=0.00195,
+    diesel=0.00273,
+    propane=0.00153,
+    fuel_oil=0.00281
+)
 
 # Mobile Combustion (tonnes CO2e per liter)
-MOBILE_COMBUSTION = {
-    'gasoline': 0.00234,
-    'diesel': 0.00267,
-    'jet_fuel': 0.00259
-}
+MOBILE_COMBUSTION = MobileCombustionFactors(
+    gasoline=0.00234,
+    diesel=0.00267,
+    jet_fuel=0.00259
+)
 
 # Refrigerants Global Warming Potentials (GWP) for 100-year time horizon
 # Values from IPCC AR5
@@ -54,30 +91,30 @@ ELECTRICITY = {
 }
 
 # Business Travel (tonnes CO2e per passenger-mile or per night)
-BUSINESS_TRAVEL = {
-    'air_short_haul': 0.000258,
-    'air_medium_haul': 0.000168,
-    'air_long_haul': 0.000153,
-    'car_rental': 0.000348,
-    'hotel_stay': 0.021  # per night
-}
+BUSINESS_TRAVEL = BusinessTravelFactors(
+    air_short_haul=0.000258,
+    air_medium_haul=0.000168,
+    air_long_haul=0.000153,
+    car_rental=0.000348,
+    hotel_stay=0.021
+)
 
 # Employee Commuting (tonnes CO2e per mile)
-COMMUTING = {
-    'car': 0.000348,
-    'carpool': 0.000162,
-    'public_transit': 0.000096,
-    'walking_biking': 0,
-    'wfh': 0.000032  # Home office energy use
-}
+COMMUTING = CommutingFactors(
+    car=0.000348,
+    carpool=0.000162,
+    public_transit=0.000096,
+    walking_biking=0,
+    wfh=0.000032
+)
 
 # Waste Disposal (tonnes CO2e per ton)
-WASTE = {
-    'landfill': 0.458,
-    'recycled': 0.021,
-    'composted': 0.023,
-    'incinerated': 0.0136
-}
+WASTE = WasteFactors(
+    landfill=0.458,
+    recycled=0.021,
+    composted=0.023,
+    incinerated=0.0136
+)
 
 # Purchased Goods & Services
 # Economic Input-Output factors (tonnes CO2e per million USD spent)
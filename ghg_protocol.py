@@ -1,6 +1,57 @@
 # GHG Protocol Calculation Functions
+import functools
+
+import numpy as np
+
 import emission_factors as ef
 
+# Factor vectors built once at import; each calculator reduces to a
+# single dot product instead of per-term Python arithmetic. The factor
+# NamedTuples are plain tuples, so field order carries over directly.
+_STATIONARY_F = np.array(ef.STATIONARY_COMBUSTION, dtype=np.float64)
+_MOBILE_F = np.array(ef.MOBILE_COMBUSTION, dtype=np.float64)
+_TRAVEL_F = np.array(ef.BUSINESS_TRAVEL, dtype=np.float64)
+_WASTE_F = np.array(ef.WASTE, dtype=np.float64)
+_COMMUTE_MODES = ef.CommutingFactors._fields
+_COMMUTE_F = np.array(ef.COMMUTING, dtype=np.float64)
+
+# Column order for the batch calculator: one entry per dot-product
+# source, concatenated scope by scope
+BATCH_SOURCES = (ef.StationaryCombustionFactors._fields
+                 + ef.MobileCombustionFactors._fields
+                 + ef.BusinessTravelFactors._fields
+                 + ef.WasteFactors._fields)
+_BATCH_F = np.concatenate([_STATIONARY_F, _MOBILE_F, _TRAVEL_F, _WASTE_F])
+
+def calculate_batch_emissions(activities):
+    """
+    Calculate total emissions for many activity profiles at once.
+
+    Parameters:
+    - activities: Array-like of shape (n_samples, len(BATCH_SOURCES)),
+      columns ordered as in BATCH_SOURCES (stationary, mobile, business
+      travel, waste)
+
+    Returns:
+    - ndarray of shape (n_samples,) with tonnes CO2e per sample
+
+    Intended for scenario sweeps and Monte-Carlo runs: one matrix-vector
+    product replaces a Python loop over the scalar calculators.
+    """
+    activities = np.asarray(activities, dtype=np.float64)
+    return activities @ _BATCH_F
+
+# UI strings come from a small fixed set, so the normalize-then-lookup
+# step is memoized instead of rebuilding the lowered key on every call
+@functools.lru_cache(maxsize=64)
+def _grid_region_factor(grid_region):
+    return ef.ELECTRICITY.get(grid_region.lower().replace(" ", "_"), ef.ELECTRICITY['default'])
+
+@functools.lru_cache(maxsize=64)
+def _industry_spend_factor(industry):
+    return ef.PURCHASED_GOODS.get(industry.lower().replace(" & ", "_").replace(" ", "_"),
+                                  ef.PURCHASED_GOODS['default'])
+
 def calculate_stationary_combustion(natural_gas=0, diesel=0, propane=0, fuel_oil=0):
     """
     Calculate emissions from stationary combustion sources.
@@ -8,13 +59,7 @@ def calculate_stationary_combustion(natural_gas=0, diesel=0, propane=0, fuel_oil
     Returns tonnes CO2e
     """
     # Convert to tonnes CO2e using emission factors
-    natural_gas_emissions = natural_gas * ef.STATIONARY_COMBUSTION['natural_gas']
-    diesel_emissions = diesel * ef.STATIONARY_COMBUSTION['diesel']
-    propane_emissions = propane * ef.STATIONARY_COMBUSTION['propane']
-    fuel_oil_emissions = fuel_oil * ef.STATIONARY_COMBUSTION['fuel_oil']
-    
-    total_emissions = natural_gas_emissions + diesel_emissions + propane_emissions + fuel_oil_emissions
-    return total_emissions
+    return float(np.dot(_STATIONARY_F, (natural_gas, diesel, propane, fuel_oil)))
 
 def calculate_mobile_combustion(gasoline=0, diesel=0, jet_fuel=0):
     """
@@ -22,12 +67,7 @@ def calculate_mobile_combustion(gasoline=0, diesel=0, jet_fuel=0):
     All inputs should be in liters.
     Returns tonnes CO2e
     """
-    gasoline_emissions = gasoline * ef.MOBILE_COMBUSTION['gasoline']
-    diesel_emissions = diesel * ef.MOBILE_COMBUSTION['diesel']
-    jet_fuel_emissions = jet_fuel * ef.MOBILE_COMBUSTION['jet_fuel']
-    
-    total_emissions = gasoline_emissions + diesel_emissions + jet_fuel_emissions
-    return total_emissions
+    return float(np.dot(_MOBILE_F, (gasoline, diesel, jet_fuel)))
 
 def calculate_refrigerant_emissions(refrigerant_type="None", amount=0.0):
     """
@@ -46,6 +86,7 @@ def calculate_refrigerant_emissions(refrigerant_type="None", amount=0.0):
     emissions = amount * ef.REFRIGERANTS.get(refrigerant_type, 0) / 1000  # Convert to tonnes
     return emissions
 
+@functools.lru_cache(maxsize=256)
 def calculate_electricity_emissions(electricity=0, grid_region="Other", electricity_source="Grid Electricity"):
     """
     Calculate emissions from electricity consumption.
@@ -65,7 +106,7 @@ def calculate_electricity_emissions(electricity=0, grid_region="Other", electric
         emissions_factor = ef.ELECTRICITY['mixed']
     else:  # Grid Electricity
         # Use region-specific factors if available
-        emissions_factor = ef.ELECTRICITY.get(grid_region.lower().replace(" ", "_"), ef.ELECTRICITY['default'])
+        emissions_factor = _grid_region_factor(grid_region)
     
     emissions = electricity * emissions_factor / 1000  # Convert to tonnes
     return emissions
@@ -84,16 +125,8 @@ def calculate_business_travel_emissions(air_travel_short=0, air_travel_medium=0,
     
     Returns emissions in tonnes CO2e
     """
-    air_short_emissions = air_travel_short * ef.BUSINESS_TRAVEL['air_short_haul']
-    air_medium_emissions = air_travel_medium * ef.BUSINESS_TRAVEL['air_medium_haul']
-    air_long_emissions = air_travel_long * ef.BUSINESS_TRAVEL['air_long_haul']
-    car_rental_emissions = car_rental * ef.BUSINESS_TRAVEL['car_rental']
-    hotel_emissions = hotel_stays * ef.BUSINESS_TRAVEL['hotel_stay']
-    
-    total_emissions = (air_short_emissions + air_medium_emissions + air_long_emissions + 
-                      car_rental_emissions + hotel_emissions)
-    
-    return total_emissions
+    return float(np.dot(_TRAVEL_F, (air_travel_short, air_travel_medium, air_travel_long,
+                                    car_rental, hotel_stays)))
 
 def calculate_employee_commuting_emissions(avg_commute_distance=0, num_employees=0, 
                                            commute_days_per_year=230, commute_mode="Car (Single Occupancy)",
@@ -114,14 +147,11 @@ def calculate_employee_commuting_emissions(avg_commute_distance=0, num_employees
     total_annual_miles = avg_commute_distance * 2 * num_employees * commute_days_per_year
     
     if commute_mode == "Mixed" and mode_breakdown:
-        # Calculate weighted emissions based on mode breakdown
-        car_emissions = total_annual_miles * mode_breakdown["car"] * ef.COMMUTING['car']
-        carpool_emissions = total_annual_miles * mode_breakdown["carpool"] * ef.COMMUTING['carpool']
-        transit_emissions = total_annual_miles * mode_breakdown["public_transit"] * ef.COMMUTING['public_transit']
-        walking_biking_emissions = total_annual_miles * mode_breakdown["walking_biking"] * ef.COMMUTING['walking_biking']
-        wfh_emissions = total_annual_miles * mode_breakdown["wfh"] * ef.COMMUTING['wfh']
-        
-        total_emissions = car_emissions + carpool_emissions + transit_emissions + walking_biking_emissions + wfh_emissions
+        # Weighted emissions are a dot product of the mode percentages
+        # against the commuting factor vector
+        pct = np.fromiter((mode_breakdown[mode] for mode in _COMMUTE_MODES),
+                          dtype=np.float64, count=len(_COMMUTE_MODES))
+        total_emissions = float(total_annual_miles * np.dot(pct, _COMMUTE_F))
     else:
         # Use single mode emission factor
         mode_mapping = {
@@ -132,7 +162,7 @@ def calculate_employee_commuting_emissions(avg_commute_distance=0, num_employees
             "Work from Home": "wfh"
         }
         
-        emission_factor = ef.COMMUTING[mode_mapping.get(commute_mode, "car")]
+        emission_factor = getattr(ef.COMMUTING, mode_mapping.get(commute_mode, "car"))
         total_emissions = total_annual_miles * emission_factor
     
     return total_emissions
@@ -149,15 +179,10 @@ def calculate_waste_emissions(landfill_waste=0, recycled_waste=0, composted_wast
     
     Returns emissions in tonnes CO2e
     """
-    landfill_emissions = landfill_waste * ef.WASTE['landfill']
-    recycled_emissions = recycled_waste * ef.WASTE['recycled']
-    composted_emissions = composted_waste * ef.WASTE['composted']
-    incinerated_emissions = incinerated_waste * ef.WASTE['incinerated']
-    
-    total_emissions = landfill_emissions + recycled_emissions + composted_emissions + incinerated_emissions
-    
-    return total_emissions
+    return float(np.dot(_WASTE_F, (landfill_waste, recycled_waste,
+                                   composted_waste, incinerated_waste)))
 
+@functools.lru_cache(maxsize=256)
 def calculate_purchased_goods_emissions(purchased_goods=0, industry="Other"):
     """
     Calculate emissions from purchased goods and services using
@@ -170,8 +195,7 @@ def calculate_purchased_goods_emissions(purchased_goods=0, industry="Other"):
     Returns emissions in tonnes CO2e
     """
     # Get industry-specific emission factor
-    industry_factor = ef.PURCHASED_GOODS.get(industry.lower().replace(" & ", "_").replace(" ", "_"), 
-                                            ef.PURCHASED_GOODS['default'])
+    industry_factor = _industry_spend_factor(industry)
     
     # Calculate emissions (convert USD to millions of USD)
     emissions = purchased_goods / 1000000 * industry_factor
@@ -1,13 +1,61 @@
 """
 Module for displaying historical carbon footprint calculations
 """
+import functools
+import math
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from database import get_all_footprints, get_footprint_by_id
+from database import get_all_footprints, get_footprint_by_id, get_footprint_summary
 import visualizations as viz
 
+# Rows per page of the saved-calculations table
+_PAGE_SIZE = 50
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_all_footprints():
+    """
+    Fetch all footprints once per minute instead of per rerun.
+
+    The save path calls _cached_all_footprints.clear() so a fresh record
+    shows up immediately rather than after the TTL.
+    """
+    return get_all_footprints()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_footprint_summary():
+    """
+    Fetch the comparison roll-up once per minute.
+
+    The display label is computed in SQL by get_footprint_summary, so no
+    per-row label building happens in Python. Cleared by the save path
+    alongside _cached_all_footprints.
+    """
+    return get_footprint_summary()
+
+@functools.lru_cache(maxsize=128)
+def _cached_footprint(record_id):
+    """
+    Fetch a footprint record once per process.
+
+    Records are immutable after saving (there are no update or delete
+    paths), so re-selecting the same id is memoized instead of hitting
+    the database on every selectbox change.
+    """
+    return get_footprint_by_id(record_id)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_scope_chart(scope_items):
+    """Build (or reuse) the scope pie for a sorted items tuple."""
+    return viz.create_emissions_by_scope_chart(dict(scope_items))
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_category_chart(category_items):
+    """Build (or reuse) the category bar chart for a sorted items tuple."""
+    return viz.create_emissions_by_category_chart(dict(category_items))
+
 def display_history_page():
     """
     Display history of carbon footprint calculations
@@ -16,16 +64,22 @@ def display_history_page():
     
     # Get all footprints from database
     try:
-        footprints_df = get_all_footprints()
+        footprints_df = _cached_all_footprints()
         
         if footprints_df.empty:
             st.info("No carbon footprint calculations have been saved yet.")
             return
         
-        # Display table of all footprints
+        # Display table of all footprints, one page at a time so the
+        # payload shipped to the browser stays bounded as history grows
         st.subheader("Saved Calculations")
+        total_pages = max(1, math.ceil(len(footprints_df) / _PAGE_SIZE))
+        if total_pages > 1:
+            page = st.number_input("Page", min_value=1, max_value=total_pages, value=1)
+        else:
+            page = 1
         st.dataframe(
-            footprints_df,
+            footprints_df.iloc[(page - 1) * _PAGE_SIZE:page * _PAGE_SIZE],
             column_config={
                 "id": st.column_config.NumberColumn("ID"),
                 "organization_name": st.column_config.TextColumn("Organization"),
@@ -52,19 +106,29 @@ def display_history_page():
             hide_index=True
         )
         
-        # Allow user to select a record to view in detail
+        # Allow user to select a record to view in detail. The labels
+        # come from a precomputed id -> (org, year) map so the
+        # format_func is a dict lookup, not a DataFrame scan per option
+        label_map = dict(zip(footprints_df["id"],
+                             zip(footprints_df["organization_name"],
+                                 footprints_df["reporting_year"])))
         record_id = st.selectbox(
             "Select a record to view details",
             footprints_df["id"].tolist(),
-            format_func=lambda x: f"ID: {x} - {footprints_df[footprints_df['id'] == x]['organization_name'].values[0]} ({footprints_df[footprints_df['id'] == x]['reporting_year'].values[0]})"
+            format_func=lambda x, m=label_map: f"ID: {x} - {m[x][0]} ({m[x][1]})"
         )
         
         if record_id:
             display_footprint_detail(record_id)
         
-        # Comparison visualization if more than one record
+        # Comparison visualization if more than one record. Gated behind
+        # a checkbox so the comparison figures are only built when the
+        # user actually asks for them (a collapsed expander would still
+        # execute its body on every rerun)
         if len(footprints_df) > 1:
-            display_comparison_visualizations(footprints_df)
+            st.subheader("Comparison Across Calculations")
+            if st.checkbox("Show comparison charts", value=False):
+                display_comparison_visualizations()
             
     except Exception as e:
         st.error(f"Error retrieving carbon footprint history: {str(e)}")
@@ -76,8 +140,8 @@ def display_footprint_detail(record_id):
     Parameters:
     - record_id: ID of the record to display
     """
-    # Get the record
-    footprint = get_footprint_by_id(record_id)
+    # Get the record (memoized: saved records never change)
+    footprint = _cached_footprint(record_id)
     
     if not footprint:
         st.error(f"Record with ID {record_id} not found.")
@@ -116,12 +180,12 @@ def display_footprint_detail(record_id):
         "Scope 2": footprint["scope2_emissions"],
         "Scope 3": footprint["scope3_emissions"]
     }
-    fig_by_scope = viz.create_emissions_by_scope_chart(emissions_by_scope)
+    fig_by_scope = _cached_scope_chart(tuple(sorted(emissions_by_scope.items())))
     st.plotly_chart(fig_by_scope, use_container_width=True)
-    
+
     # Emissions by category chart
     st.subheader("Emissions by Category")
-    fig_by_category = viz.create_emissions_by_category_chart(footprint["emissions_by_category"])
+    fig_by_category = _cached_category_chart(tuple(sorted(footprint["emissions_by_category"].items())))
     st.plotly_chart(fig_by_category, use_container_width=True)
     
     # Detailed breakdown table
@@ -131,8 +195,9 @@ def display_footprint_detail(record_id):
         "Emissions (tonnes CO₂e)": list(footprint["emissions_by_category"].values())
     })
     emissions_df = emissions_df.sort_values("Emissions (tonnes CO₂e)", ascending=False)
-    emissions_df["Percentage"] = emissions_df["Emissions (tonnes CO₂e)"] / emissions_df["Emissions (tonnes CO₂e)"].sum() * 100
-    emissions_df["Percentage"] = emissions_df["Percentage"].apply(lambda x: f"{x:.1f}%")
+    # Vectorized share + formatting instead of a per-row apply lambda
+    pct = emissions_df["Emissions (tonnes CO₂e)"] / emissions_df["Emissions (tonnes CO₂e)"].sum() * 100
+    emissions_df["Percentage"] = pct.map("{:.1f}%".format)
     
     st.dataframe(
         emissions_df,
@@ -142,21 +207,15 @@ def display_footprint_detail(record_id):
         }
     )
 
-def display_comparison_visualizations(footprints_df):
+def display_comparison_visualizations():
     """
     Display visualizations comparing multiple carbon footprint records
-    
-    Parameters:
-    - footprints_df: DataFrame with footprint records
     """
-    st.subheader("Comparison Across Calculations")
-    
-    # Create a combined label for better readability
-    footprints_df["label"] = footprints_df.apply(
-        lambda row: f"{row['organization_name']} ({row['reporting_year']})", 
-        axis=1
-    )
-    
+    # The roll-up arrives label-ready from the database: the combined
+    # "Organization (Year)" column is concatenated in SQL, so nothing is
+    # recomputed per row here
+    footprints_df = _cached_footprint_summary()
+
     # Total emissions comparison
     fig_total = px.bar(
         footprints_df,
@@ -169,17 +228,26 @@ def display_comparison_visualizations(footprints_df):
     fig_total.update_layout(xaxis_tickangle=-45)
     st.plotly_chart(fig_total, use_container_width=True)
     
-    # Emissions by scope comparison
-    scope_data = []
-    for _, row in footprints_df.iterrows():
-        scope_data.extend([
-            {"Organization": row["label"], "Scope": "Scope 1", "Emissions": row["scope1_emissions"]},
-            {"Organization": row["label"], "Scope": "Scope 2", "Emissions": row["scope2_emissions"]},
-            {"Organization": row["label"], "Scope": "Scope 3", "Emissions": row["scope3_emissions"]}
-        ])
-    
-    scope_df = pd.DataFrame(scope_data)
-    
+    # Emissions by scope comparison: melt the three scope columns into
+    # long form in one C-level pass instead of iterating rows
+    scope_df = footprints_df.melt(
+        id_vars=["label"],
+        value_vars=["scope1_emissions", "scope2_emissions", "scope3_emissions"],
+        var_name="Scope",
+        value_name="Emissions"
+    ).rename(columns={"label": "Organization"})
+    scope_df["Scope"] = scope_df["Scope"].map({
+        "scope1_emissions": "Scope 1",
+        "scope2_emissions": "Scope 2",
+        "scope3_emissions": "Scope 3"
+    })
+
+    # Zero scopes would only render empty bars; drop them and pin the
+    # axis order so plotly doesn't re-sort client-side
+    scope_df = scope_df[scope_df["Emissions"] > 0]
+    labels_by_total = footprints_df.sort_values(
+        "total_emissions", ascending=False)["label"].tolist()
+
     fig_scope = px.bar(
         scope_df,
         x="Organization",
@@ -187,7 +255,8 @@ def display_comparison_visualizations(footprints_df):
         color="Scope",
         title="Emissions by Scope Comparison",
         labels={"Emissions": "Emissions (tonnes CO₂e)"},
-        barmode="group"
+        barmode="group",
+        category_orders={"Organization": labels_by_total}
     )
     fig_scope.update_layout(xaxis_tickangle=-45)
     st.plotly_chart(fig_scope, use_container_width=True)
\ No newline at end of file
@@ -2,15 +2,56 @@
 PDF and Excel report generation for the Carbon Footprint Calculator
 """
 import io
-import base64
 from datetime import datetime
-import pandas as pd
+import numpy as np
+import xlsxwriter
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 
+# Reportlab styles are immutable once built, so the stylesheet, the
+# custom heading style and the two table styles are constructed once at
+# import and shared by every report
+_STYLES = getSampleStyleSheet()
+_TABLE_TITLE_STYLE = ParagraphStyle(
+    'TableTitle',
+    parent=_STYLES['Heading3'],
+    fontSize=12,
+    leading=14,
+    spaceBefore=10,
+    spaceAfter=4
+)
+_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgreen),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+])
+
+def _sorted_category_breakdown(emissions_by_category, total_emissions):
+    """
+    Sort categories by emissions (descending) and compute their shares.
+
+    Shared by the PDF and Excel generators so the sort and the percentage
+    division each happen once per report.
+
+    Returns:
+    - (categories, values, percentages) with values/percentages as arrays
+    """
+    categories = list(emissions_by_category.keys())
+    values = np.fromiter(emissions_by_category.values(), dtype=np.float64,
+                         count=len(categories))
+    order = np.argsort(-values, kind='stable')
+    categories = [categories[i] for i in order]
+    values = values[order]
+    percentages = values / total_emissions * 100 if total_emissions > 0 else np.zeros_like(values)
+    return categories, values, percentages
+
 def generate_pdf_report(organization_name, industry, reporting_year, num_employees,
                         total_emissions, emissions_by_scope, emissions_by_category,
                         recommendations):
@@ -38,23 +79,14 @@ def generate_pdf_report(organization_name, industry, reporting_year, num_employe
                             leftMargin=0.5*inch, rightMargin=0.5*inch,
                             topMargin=0.5*inch, bottomMargin=0.5*inch)
     
-    # Get styles
-    styles = getSampleStyleSheet()
+    # Shared styles, built once at module import
+    styles = _STYLES
     title_style = styles['Title']
     heading_style = styles['Heading1']
     subheading_style = styles['Heading2']
     normal_style = styles['Normal']
-    
-    # Custom styles
-    table_title_style = ParagraphStyle(
-        'TableTitle',
-        parent=styles['Heading3'],
-        fontSize=12,
-        leading=14,
-        spaceBefore=10,
-        spaceAfter=4
-    )
-    
+    table_title_style = _TABLE_TITLE_STYLE
+
     # Content elements
     elements = []
     
@@ -86,15 +118,7 @@ def generate_pdf_report(organization_name, industry, reporting_year, num_employe
     
     # Create table
     scope_table = Table(scope_data, colWidths=[2*inch, 2*inch, 1.5*inch])
-    scope_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgreen),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-    ]))
+    scope_table.setStyle(_TABLE_STYLE)
     
     elements.append(scope_table)
     elements.append(Spacer(1, 0.2*inch))
@@ -102,25 +126,17 @@ def generate_pdf_report(organization_name, industry, reporting_year, num_employe
     # Emissions by category
     elements.append(Paragraph("Emissions by Category", subheading_style))
     
-    # Create table data
+    # Create table data; sort and percentages computed once, vectorized
+    categories, values, percentages = _sorted_category_breakdown(emissions_by_category,
+                                                                 total_emissions)
     category_data = [['Category', 'Emissions (tonnes CO₂e)', 'Percentage']]
-    sorted_categories = sorted(emissions_by_category.items(), key=lambda x: x[1], reverse=True)
-    
-    for category, value in sorted_categories:
-        percentage = (value / total_emissions) * 100 if total_emissions > 0 else 0
-        category_data.append([category, f"{value:.2f}", f"{percentage:.1f}%"])
+    category_data.extend([category, f"{value:.2f}", f"{percentage:.1f}%"]
+                         for category, value, percentage
+                         in zip(categories, values, percentages))
     
     # Create table
     category_table = Table(category_data, colWidths=[3*inch, 2*inch, 1.5*inch])
-    category_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgreen),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-    ]))
+    category_table.setStyle(_TABLE_STYLE)
     
     elements.append(category_table)
     elements.append(Spacer(1, 0.3*inch))
@@ -129,7 +145,7 @@ def generate_pdf_report(organization_name, industry, reporting_year, num_employe
     elements.append(Paragraph("Key Recommendations", subheading_style))
     
     # Find top 3 emission categories
-    top_categories = [cat for cat, _ in sorted_categories[:3]]
+    top_categories = categories[:3]
     
     for category in top_categories:
         if category in recommendations:
@@ -160,92 +176,71 @@ def generate_excel_report(organization_name, industry, reporting_year, num_emplo
     - Excel file as bytes
     """
     buffer = io.BytesIO()
-    
-    # Create a new Excel writer object
-    with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
-        workbook = writer.book
-        
-        # Summary sheet
-        summary_data = {
-            "Metric": ["Organization", "Industry", "Reporting Year", "Number of Employees", 
-                      "Total Emissions (tonnes CO₂e)"],
-            "Value": [organization_name, industry, reporting_year, num_employees, 
-                     f"{total_emissions:.2f}"]
-        }
-        summary_df = pd.DataFrame(summary_data)
-        summary_df.to_excel(writer, sheet_name='Summary', index=False)
-        
-        # Format Summary sheet
-        summary_sheet = writer.sheets['Summary']
-        summary_sheet.set_column('A:A', 25)
-        summary_sheet.set_column('B:B', 20)
-        
-        # Emissions by Scope sheet
-        scope_data = {
-            "Scope": list(emissions_by_scope.keys()),
-            "Emissions (tonnes CO₂e)": list(emissions_by_scope.values()),
-            "Percentage": [(value / total_emissions) * 100 if total_emissions > 0 else 0 
-                          for value in emissions_by_scope.values()]
-        }
-        scope_df = pd.DataFrame(scope_data)
-        scope_df.to_excel(writer, sheet_name='Emissions by Scope', index=False)
-        
-        # Format Scope sheet
-        scope_sheet = writer.sheets['Emissions by Scope']
-        scope_sheet.set_column('A:A', 15)
-        scope_sheet.set_column('B:B', 25)
-        scope_sheet.set_column('C:C', 15)
-        
-        # Emissions by Category sheet
-        category_data = {
-            "Category": list(emissions_by_category.keys()),
-            "Emissions (tonnes CO₂e)": list(emissions_by_category.values()),
-            "Percentage": [(value / total_emissions) * 100 if total_emissions > 0 else 0 
-                          for value in emissions_by_category.values()]
-        }
-        category_df = pd.DataFrame(category_data)
-        category_df = category_df.sort_values("Emissions (tonnes CO₂e)", ascending=False)
-        category_df.to_excel(writer, sheet_name='Emissions by Category', index=False)
-        
-        # Format Category sheet
-        category_sheet = writer.sheets['Emissions by Category']
-        category_sheet.set_column('A:A', 25)
-        category_sheet.set_column('B:B', 25)
-        category_sheet.set_column('C:C', 15)
-        
-        # Recommendations sheet
-        recommendations_data = []
+
+    # The sheets have small fixed schemas, so rows are written straight
+    # through xlsxwriter's write_row instead of the pandas to_excel
+    # machinery. constant_memory flushes each row as it is written and
+    # in_memory avoids tempfile I/O, keeping peak memory flat.
+    workbook = xlsxwriter.Workbook(buffer, {'constant_memory': True, 'in_memory': True})
+    header_format = workbook.add_format({'bold': True})
+
+    # Summary sheet
+    summary_sheet = workbook.add_worksheet('Summary')
+    summary_sheet.set_column('A:A', 25)
+    summary_sheet.set_column('B:B', 20)
+    summary_sheet.write_row(0, 0, ("Metric", "Value"), header_format)
+    summary_rows = (
+        ("Organization", organization_name),
+        ("Industry", industry),
+        ("Reporting Year", reporting_year),
+        ("Number of Employees", num_employees),
+        ("Total Emissions (tonnes CO₂e)", f"{total_emissions:.2f}")
+    )
+    for i, row in enumerate(summary_rows, start=1):
+        summary_sheet.write_row(i, 0, row)
+
+    # Emissions by Scope sheet
+    scope_sheet = workbook.add_worksheet('Emissions by Scope')
+    scope_sheet.set_column('A:A', 15)
+    scope_sheet.set_column('B:B', 25)
+    scope_sheet.set_column('C:C', 15)
+    scope_sheet.write_row(0, 0, ("Scope", "Emissions (tonnes CO₂e)", "Percentage"), header_format)
+    scope_values = np.fromiter(emissions_by_scope.values(), dtype=np.float64,
+                               count=len(emissions_by_scope))
+    scope_percentages = (scope_values / total_emissions * 100 if total_emissions > 0
+                         else np.zeros_like(scope_values))
+    for i, (scope, value, share) in enumerate(zip(emissions_by_scope,
+                                                  scope_values,
+                                                  scope_percentages), start=1):
+        scope_sheet.write_row(i, 0, (scope, value, share))
+
+    # Emissions by Category sheet, pre-sorted by the shared helper
+    category_sheet = workbook.add_worksheet('Emissions by Category')
+    category_sheet.set_column('A:A', 25)
+    category_sheet.set_column('B:B', 25)
+    category_sheet.set_column('C:C', 15)
+    category_sheet.write_row(0, 0, ("Category", "Emissions (tonnes CO₂e)", "Percentage"), header_format)
+    categories, values, percentages = _sorted_category_breakdown(emissions_by_category,
+                                                                 total_emissions)
+    for i, (category, value, share) in enumerate(zip(categories, values, percentages), start=1):
+        category_sheet.write_row(i, 0, (category, value, share))
+
+    # Recommendations sheet
+    if recommendations:
+        rec_sheet = workbook.add_worksheet('Recommendations')
+        rec_sheet.set_column('A:A', 25)
+        rec_sheet.set_column('B:B', 60)
+        rec_sheet.write_row(0, 0, ("Category", "Recommendation"), header_format)
+        i = 1
         for category, recs in recommendations.items():
             for rec in recs:
-                recommendations_data.append({"Category": category, "Recommendation": rec})
-        
-        if recommendations_data:
-            rec_df = pd.DataFrame(recommendations_data)
-            rec_df.to_excel(writer, sheet_name='Recommendations', index=False)
-            
-            # Format Recommendations sheet
-            rec_sheet = writer.sheets['Recommendations']
-            rec_sheet.set_column('A:A', 25)
-            rec_sheet.set_column('B:B', 60)
-    
+                rec_sheet.write_row(i, 0, (category, rec))
+                i += 1
+
+    workbook.close()
+
     # Get the Excel data
     excel_data = buffer.getvalue()
     buffer.close()
-    
-    return excel_data
 
-def get_download_link(file_data, file_name, display_text):
-    """
-    Generate a download link for a given file.
-    
-    Parameters:
-    - file_data: File data as bytes
-    - file_name: Name of the file to download
-    - display_text: Text to display for the download link
-    
-    Returns:
-    - HTML string with the download link
-    """
-    b64 = base64.b64encode(file_data).decode()
-    href = f'<a href="data:application/octet-stream;base64,{b64}" download="{file_name}" class="download-button">{display_text}</a>'
-    return href
\ No newline at end of file
+    return excel_data
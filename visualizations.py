@@ -16,25 +16,22 @@ def create_emissions_by_scope_chart(emissions_by_scope):
     """
     labels = list(emissions_by_scope.keys())
     values = list(emissions_by_scope.values())
-    
+
     # Custom colors for the scopes
     colors = ['#3366CC', '#DC3912', '#FF9900']
-    
-    fig = px.pie(
-        names=labels,
+
+    # Build the pie directly with graph_objects: same output as px.pie
+    # without the plotly-express DataFrame inference pass
+    fig = go.Figure(data=[go.Pie(
+        labels=labels,
         values=values,
-        title="Carbon Footprint by Scope",
-        color_discrete_sequence=colors,
-        hole=0.4
-    )
-    
-    # Improve layout and appearance
-    fig.update_traces(
+        hole=0.4,
+        marker=dict(colors=colors),
         textinfo='percent+label',
         textposition='outside',
-        hoverinfo='label+value',
         hovertemplate='%{label}: %{value:.2f} tonnes CO₂e<extra></extra>'
-    )
+    )])
+    fig.update_layout(title="Carbon Footprint by Scope")
     
     # Add annotations for total emissions
     total = sum(values)